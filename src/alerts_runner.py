@@ -33,7 +33,17 @@ Key Features:
 """
 
 import os
+import atexit
+import shutil
+import multiprocessing
+import logging
+import asyncio
+import hashlib
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date, timedelta
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
 from requests import Response
 
 from global_state import state
@@ -48,20 +58,47 @@ summary_round_trip_list_by_city_pairing_by_cabin = dict[CABIN, dict[tuple[str, s
 summary_trip_list_by_cabin = dict[CABIN, list[summary_trip]]
 
 
-from logic.trip_builder import RoundTrip, format_availability_object, TripOption
-from logic.pdf_generator import generate_pdf_for_round_trips, generate_pdf_for_single_trips
+from logic.trip_builder import Trip, RoundTrip, format_availability_object, TripOption
 from logic.trip_builder import Route
 
 from currencies.cash import cents_to_str
 
 from services.seats_aero import seats_aero_handler
 from services.email import email_self
-from services.google_sheets import handler as sheets_handler  
+from services.unsplash import DEFAULT_FOLDER as IMAGES_FOLDER
+
+# logic.pdf_generator (fpdf) and services.google_sheets (gspread/google-auth) are
+# only needed when broadcasting, so they are imported lazily where used.
+if TYPE_CHECKING:
+    from services.google_sheets import SpreadSheet
 
 from data_types.enums import SOURCE, REGION, CABIN
 from data_types.pdf_types import PDF_OBJ
 from data_types.flight_options import FlightOptions
 
+# Enum members in definition order, materialized once for the search loops
+_ALL_REGIONS = tuple(REGION)
+_ALL_SOURCES = tuple(SOURCE)
+
+@lru_cache(maxsize=512)
+def _region_of_country(country: str) -> REGION:
+    """
+    Resolve the REGION a country belongs to, memoized per country code.
+    
+    config.COUNTRY_REGION is loaded once at startup and never changes
+    afterwards, which makes the lookup pure and safe to cache.
+    
+    Args:
+        country (str): Country code (e.g., "BR", "US")
+        
+    Returns:
+        REGION: Region of the country
+        
+    Raises:
+        ValueError: If the country or its region is unknown (not cached)
+    """
+    return REGION.from_country(country, config.COUNTRY_REGION)
+
 
 def GET_round_from_region_to_region(
         origin: REGION, 
@@ -114,7 +151,7 @@ def GET_round_from_region_to_region(
     Note:
         - Uses configuration settings for regions, dates, cabins, and limits
         - Updates global state flags for progress tracking
-        - Implements time-based release scheduling (morning/noon/night cycles)
+        - Stamps every formatted option with the run date as its release date
         - Randomizes trip order for marketing variety
         - Handles partial failures gracefully where possible
         - Logs all major steps for monitoring and debugging
@@ -139,11 +176,10 @@ def GET_round_from_region_to_region(
         ...     print(f"Error processing flight alerts: {response}")   
     """
     state.logger.info("Starting flight alert pipeline execution")
-    sources = [source for source in SOURCE]
 
-    bulk_availability_search_by_source_list: dict[SOURCE, list] = dict()
-    for source in sources:
-        bulk_availability_search_result = seats_aero_handler.fetch_bulk_availability(
+    # Each source is an independent, network-bound request, so fetch them concurrently
+    results = _fetch_bulk_availability_grid({
+        source: dict(
             source=source,
             start_date=start_date,
             end_date=end_date,
@@ -151,7 +187,12 @@ def GET_round_from_region_to_region(
             destination_region=destination,
             deepness=deepness
         )
+        for source in _ALL_SOURCES
+    })
 
+    bulk_availability_search_by_source_list: dict[SOURCE, list] = dict()
+    for source in _ALL_SOURCES:
+        bulk_availability_search_result = results.get(source)
         if not bulk_availability_search_result:
             state.logger.error(f"No data found for source: {source}")
             continue
@@ -169,7 +210,7 @@ def GET_round_from_region_to_region(
 
 
     topNRoundTrips: summary_round_trip_list_by_city_pairing_by_cabin = flight_Filter.get_best_round_trips_from_multiple_sources(
-        bulk_availability_by_source=bulk_availability_search_by_source_list,
+        bulk_availability_by_source=_drain(bulk_availability_search_by_source_list),
         cabins=cabins,
         min_return_days=min_return_days,
         max_return_days=max_return_days,
@@ -219,13 +260,17 @@ def GET_round_from_country_to_world(
     
     This function is a wrapper around the main flight alert pipeline to handle
     requests for flights originating from a specific country to all world regions.
+
+    All bulk searches (every world region in both directions, for every
+    source) are issued concurrently on one event loop with bounded
+    concurrency, so the fetch phase costs a few round trips rather than one
+    per region and source.
     
     Args:
         country (str): Country name or code to fetch flights from
-        source (SOURCE): Mileage source enum (e.g., SOURCE.azul)
         start_date (str): Search start date in YYYY-MM-DD format
         end_date (str): Search end date in YYYY-MM-DD format
-        cabins (list[CABIN], optional): List of cabin classes to include
+        cabin (list[CABIN], optional): List of cabin classes to include
         min_return_days (int): Minimum days between outbound and return flights (default: 1)
         max_return_days (int): Maximum days between outbound and return flights (default: 60)
         n (int): Number of top trips to process (default: 1)
@@ -243,58 +288,64 @@ def GET_round_from_country_to_world(
         return Response(status=400, data={"error": "Country must be specified."})
 
     try:
-        origin_region = REGION.from_country(country, config.COUNTRY_REGION)
+        origin_region = _region_of_country(country)
     except ValueError as e:
         state.logger.error(f"Could not find a valid region for the specified country: {country}. Error: {str(e)}")
         return {"status": 400, "data": {"error": "Could not find a valid region for the specified country."}}
 
     state.logger.info(f"Fetching flights from {country} ({origin_region.value}) to all world regions")
 
-    bulk_availability_search_by_source_by_region_list: dict[REGION, dict[SOURCE, list]] = dict()
-    hasTrips = False
-    for region in REGION:
-        if region not in bulk_availability_search_by_source_by_region_list:
-            bulk_availability_search_by_source_by_region_list[region] = dict()
-        for source in SOURCE:
-            new_deepness = deepness if region != origin_region else deepness * 2
-            response = seats_aero_handler.fetch_bulk_availability(
-                source=source,
-                start_date=start_date,
-                end_date=end_date,
-                origin_region=origin_region,
-                destination_region=region,
-                deepness=new_deepness,
-                cabin=cabin
-            )
-            if not response and len(response) == 0:
-                continue
-            if region not in bulk_availability_search_by_source_by_region_list:
-                bulk_availability_search_by_source_by_region_list[region] = dict()
-            if source not in bulk_availability_search_by_source_by_region_list[region]:
-                bulk_availability_search_by_source_by_region_list[region][source] = []
-            bulk_availability_search_by_source_by_region_list[region][source].extend(response)
-
-            if region == origin_region:
-                hasTrips = True
-                continue
-
-            response = seats_aero_handler.fetch_bulk_availability(
+    # Every (region, source) fetch is independent, so the grid is dispatched to a
+    # bounded pool and folded back into the result dict on this thread afterwards.
+    # Without outbound data there is nothing to pair return legs with, so the
+    # reverse search for a (region, source) pair is only issued once its forward
+    # search came back with results. It is queued as soon as that happens, so
+    # reverse searches overlap with the forward searches still in flight.
+    def reverse_search(key: tuple, response: list) -> dict[tuple, dict]:
+        region, source, search_origin = key
+        if not response or region == origin_region or search_origin != origin_region:
+            return {}
+        return {
+            (region, source, region): dict(
                 source=source,
                 start_date=start_date,
                 end_date=end_date,
                 origin_region=region,
                 destination_region=origin_region,
-                deepness=new_deepness,
+                deepness=deepness,
                 cabin=cabin
             )
-            if not response and len(response) == 0:
+        }
+
+    results = _fetch_bulk_availability_grid({
+        (region, source, origin_region): dict(
+            source=source,
+            start_date=start_date,
+            end_date=end_date,
+            origin_region=origin_region,
+            destination_region=region,
+            deepness=deepness if region != origin_region else deepness * 2,
+            cabin=cabin
+        )
+        for region in _ALL_REGIONS
+        for source in _ALL_SOURCES
+    }, follow_up=reverse_search)
+
+    bulk_availability_search_by_source_by_region_list: dict[REGION, dict[SOURCE, list]] = defaultdict(lambda: defaultdict(list))
+    for region in _ALL_REGIONS:
+        for source in _ALL_SOURCES:
+            response = results.get((region, source, origin_region))
+            if not response:
                 continue
-            if source not in bulk_availability_search_by_source_by_region_list[region]:
-                bulk_availability_search_by_source_by_region_list[region][source] = []
             bulk_availability_search_by_source_by_region_list[region][source].extend(response)
+            if region != origin_region:
+                bulk_availability_search_by_source_by_region_list[region][source].extend(results.get((region, source, region)) or [])
 
-            hasTrips = True
+    dead_regions = set(_ALL_REGIONS) - bulk_availability_search_by_source_by_region_list.keys()
+    if dead_regions:
+        state.logger.info(f"No outbound data (reverse searches skipped) for regions: {[region.name for region in dead_regions]}")
 
+    hasTrips = bool(bulk_availability_search_by_source_by_region_list)
 
     if not hasTrips:
         state.logger.error(f"No data found in bulk availability search for country: {country}.")
@@ -303,60 +354,47 @@ def GET_round_from_country_to_world(
     state.update_flag('flightsRetrieved')
     state.logger.info(f"Flights retrieved successfully with length: {len(bulk_availability_search_by_source_by_region_list)}")
 
-    state.logger.info("Starting to filter top N round trips from multiple sources")
-    best_trips_by_region: dict[REGION, dict[CABIN, dict[tuple[str, str], list[summary_trip_list_by_cabin]]]] = dict()
-    hasTrips = False
-    for region, bulk_availability in bulk_availability_search_by_source_by_region_list.items():
-        result = flight_Filter.get_best_round_trips_from_multiple_sources(
-            bulk_availability_by_source=bulk_availability,
+    # Filter, format and broadcast one region at a time, so only a single region's
+    # intermediate results are alive at any point instead of every region's.
+    state.logger.info("Starting to filter, format and broadcast top N round trips region by region")
+    hasAnalysedTrips = False
+    hasFlightOptions = False
+    availability_cache: dict[str, dict] = dict()
+    for region in list(bulk_availability_search_by_source_by_region_list):
+        bulk_availability = bulk_availability_search_by_source_by_region_list.pop(region)
+        trips = flight_Filter.get_best_round_trips_from_multiple_sources(
+            bulk_availability_by_source=_drain(bulk_availability),
             cabins=cabin,
             min_return_days=min_return_days,
             max_return_days=max_return_days,
             n=n,
             filter={"origin_country": country}
         )
-        if not result:
+        del bulk_availability
+        if not trips:
             state.logger.warning(f"No best trips found for region: {region}")
             continue
-        if region not in best_trips_by_region:
-            best_trips_by_region[region] = dict()
-        best_trips_by_region[region] = result
-        hasTrips = True
+        hasAnalysedTrips = True
 
-    if not hasTrips:
+        options = format_round_flights(trips, region.name, availability_cache)
+        if not options or not options.round_options:
+            state.logger.warning(f"No flight options found for region: {region}")
+            continue
+        hasFlightOptions = True
+
+        state.logger.info(f"Broadcasting flight options for region: {region}")
+        broadcast_round_flights(options, n)
+
+    if not hasAnalysedTrips:
         state.logger.error("No data found in getBestRoundTrips")
         return {"status": 204, "data": {"error": "No valid flights found."}}
 
     state.update_flag('flightsAnalysed')
     state.logger.info(f"Flights analysed")
 
-    hasTrips = False
-    flight_options_by_region: dict[REGION, FlightOptions] = dict()
-    for region, trips in best_trips_by_region.items():
-        if trips is None or len(trips) == 0:
-            state.logger.warning(f"No trips found for region: {region}")
-            continue
-        result = format_round_flights(trips, region.name)
-        if not result:
-            state.logger.warning(f"No flight options found for region: {region}")
-            continue
-        flight_options_by_region[region] = result     
-        hasTrips = True
-
-    if not hasTrips:
+    if not hasFlightOptions:
         return {"status": 204, "data":{"error": "No valid flight options found"}}
-    
-    for options in flight_options_by_region.values():
-        # Generate PDFs for each flight option
-        state.logger.info(f"Generating PDFs for flight options")
-        broadcast_round_flights(options, n)
 
-    # Delete the files used in the response so the server isn't overloaded with files
-    #for options in flight_options_by_region.values():
-    #    clear_round(options.round_options)
-
-    #clear_pdfs(*pdfs_list)
-    
     return {"status": 200, "data": {"message": "Flight options processed successfully"}}
 
 def GET_single_from_country_to_world(
@@ -393,28 +431,31 @@ def GET_single_from_country_to_world(
         return {"status": 400, "message": "Country must be specified."}
 
     try:
-        origin_region = REGION.from_country(country, config.COUNTRY_REGION)
+        origin_region = _region_of_country(country)
     except ValueError as e:
         return {"status": 400, "message": str(e)}   
 
     state.logger.info(f"Fetching flights from {country} ({origin_region.value}) to all world regions")
 
-    # Call the main pipeline function with the specified country and region
-    search_result: dict[REGION, dict[SOURCE, list]] = dict()
-    for region in REGION:
-        if region not in search_result:
-            search_result[region] = dict()
-        for source in SOURCE:
-            response = seats_aero_handler.fetch_bulk_availability(
-                source=source,
-                start_date=start_date,
-                end_date=end_date,
-                origin_region=origin_region,
-                destination_region=region,
-                deepness=deepness
-            )
-            if source not in search_result:
-                search_result[region][source] = []
+    # Every (region, source) fetch is independent, so the grid is dispatched to a
+    # bounded pool and folded back into the result dict on this thread afterwards
+    results = _fetch_bulk_availability_grid({
+        (region, source): dict(
+            source=source,
+            start_date=start_date,
+            end_date=end_date,
+            origin_region=origin_region,
+            destination_region=region,
+            deepness=deepness
+        )
+        for region in _ALL_REGIONS
+        for source in _ALL_SOURCES
+    })
+
+    search_result: dict[REGION, dict[SOURCE, list]] = defaultdict(lambda: defaultdict(list))
+    for region in _ALL_REGIONS:
+        for source in _ALL_SOURCES:
+            response = results.get((region, source))
             if response:  # Only extend if response is not empty
                 search_result[region][source].extend(response)
 
@@ -430,7 +471,7 @@ def GET_single_from_country_to_world(
     best_trips_by_cabin_by_region: dict[REGION, dict[CABIN, list[summary_trip]]] = dict()
     for region, bulk_availability in search_result.items():
         best_trips_by_cabin_by_region[region] = flight_Filter.getTopNTripsFromMultipleSources(
-            bulk_availability_by_source=bulk_availability,
+            bulk_availability_by_source=_drain(bulk_availability),
             cabins=cabins,
             n=n,
             filter={"origin_country": country}
@@ -439,9 +480,17 @@ def GET_single_from_country_to_world(
     state.update_flag('flightsAnalysed')
     state.logger.info(f"Flights analysed.")
 
+    # Fetch every region's trip details in one concurrent batch up front, so
+    # the per-region formatting below only does cache lookups
+    availability_cache = _prefetch_availability({
+        trip.ID
+        for trips_by_cabin in best_trips_by_cabin_by_region.values()
+        for trips in trips_by_cabin.values()
+        for trip in trips
+    })
     flight_options: dict[REGION, dict[CABIN, list[TripOption]]] = dict()
     for region, options_by_cabin in best_trips_by_cabin_by_region.items():
-        flight_options[region] = format_single_flights(options_by_cabin, region.name)
+        flight_options[region] = format_single_flights(options_by_cabin, region.name, availability_cache)
 
     if (not flight_options) or (len(flight_options) == 0):
         state.logger.error("No valid flight options found.")
@@ -457,7 +506,11 @@ def GET_single_from_country_to_world(
 
     return {"status": 200, "message": "Success"}
 
-def format_single_flights(trips_by_cabin: dict[CABIN, list[summary_trip]], region: str) -> dict[CABIN, list[TripOption]]:
+def format_single_flights(
+        trips_by_cabin: dict[CABIN, list[summary_trip]],
+        region: str,
+        availability_cache: dict[str, dict] = None
+    ) -> dict[CABIN, list[TripOption]]:
     """
     Format top N round trips into RoundTripOptions.
     
@@ -466,6 +519,8 @@ def format_single_flights(trips_by_cabin: dict[CABIN, list[summary_trip]], regio
 
     Args:
         trips_by_cabin dict[CABIN, list[summary_trip]]: Filtered trips listed by cabin
+        availability_cache (dict[str, dict], optional): Per-invocation availability
+            cache, shared between calls so the same trip ID is fetched only once
     Returns:
         dict[CABIN, list[TripOption]]: Dictionary of formatted trips by cabin class
     Note: 
@@ -476,16 +531,28 @@ def format_single_flights(trips_by_cabin: dict[CABIN, list[summary_trip]], regio
         state.logger.warning("No trips found for formatting.")
         return {}
 
+    availability_cache = _prefetch_availability(
+        {trip.ID for trips in trips_by_cabin.values() for trip in trips},
+        availability_cache
+    )
+
+    today_str = date.today().strftime("%Y-%m-%d")
     tripOptions: dict[CABIN, list[TripOption]] = dict()
     for cabin, trips in trips_by_cabin.items():
         state.logger.info(f"Formatting top N round trips for cabin: {cabin.name}")
         if cabin not in tripOptions:
                 tripOptions[cabin] = []
         for trip in trips:
-            formatted_trip = format_availability_object(seats_aero_handler.fetch_availability(trip.ID), region)
+            availability = availability_cache.get(trip.ID)
+            if not availability:
+                continue
+            formatted_trip = format_availability_object(availability, region)
+            if formatted_trip is None:
+                state.logger.warning("Failed to format availability for trip %s", trip.ID)
+                continue
             
             tripOptions[cabin].append(TripOption(
-                release_date=f"{(date.today().strftime("%Y-%m-%d"))}",
+                release_date=today_str,
                 trip=formatted_trip
             ))
         
@@ -495,7 +562,11 @@ def format_single_flights(trips_by_cabin: dict[CABIN, list[summary_trip]], regio
 
 
 
-def format_round_flights(trips_by_cabin: summary_round_trip_list_by_city_pairing_by_cabin, region: str) -> FlightOptions:
+def format_round_flights(
+        trips_by_cabin: summary_round_trip_list_by_city_pairing_by_cabin,
+        region: str,
+        availability_cache: dict[str, dict] = None
+    ) -> FlightOptions:
     """
     Format top N round trips into RoundTripOptions.
     This function takes the filtered top N round trips and formats them into
@@ -503,6 +574,8 @@ def format_round_flights(trips_by_cabin: summary_round_trip_list_by_city_pairing
     Args:
         topNRoundTrips (summary_round_trip_list_by_cabin): Filtered top N round
         trips
+        availability_cache (dict[str, dict], optional): Per-invocation availability
+            cache, shared between calls so the same trip ID is fetched only once
     Returns:
         dict[CABIN, list[RoundTripOptions]]: Dictionary of formatted round trips by cabin class
     Note:
@@ -513,86 +586,192 @@ def format_round_flights(trips_by_cabin: summary_round_trip_list_by_city_pairing
     single_trips: list[TripOption] = []
     round_relation_trips: list[RoundTrip] = []
     round_options: list[Route] = [] 
+
+    availability_cache = _prefetch_availability({
+        leg.ID
+        for city_pairings_round_trips in trips_by_cabin.values()
+        for round_trips in city_pairings_round_trips.values()
+        for round_trip in round_trips
+        for leg in (round_trip.outbound, round_trip.return_)
+        if leg is not None
+    }, availability_cache)
+
+    today_str = date.today().strftime("%Y-%m-%d")
+
+    # Bind names used on every iteration to locals to skip repeated global and
+    # attribute lookups inside the nested loops
+    logger = state.logger
+    iata_country = config.IATA_COUNTRY
+    get_availability = availability_cache.get
+
+    # Legs repeat across round trips (one outbound paired with several returns,
+    # the same pair in several cabins) but only depend on their availability
+    # ID, so each unique leg is formatted once and reused
+    formatted_legs: dict[str, Trip | None] = dict()
+    def format_leg(leg_id: str) -> Trip | None:
+        if leg_id not in formatted_legs:
+            formatted_legs[leg_id] = format_availability_object(get_availability(leg_id), region)
+        return formatted_legs[leg_id]
     
     for cabin, city_pairings_round_trips in trips_by_cabin.items():
-        state.logger.info(f"Formatting top N round trips for cabin: {cabin.name}")
+        logger.info("Formatting top N round trips for cabin: %s", cabin.name)
 
         for city_pairing, round_trips in city_pairings_round_trips.items():
-            optionID = str(hash(f"{city_pairing}-{cabin}-{date.today()}"))
-            state.logger.info(f"Formatting {len(round_trips)} round trips for city pairing: {city_pairing}")
-            formmatted_round_trips: list[RoundTrip] = []
+            # Stable across processes, unlike the builtin (salted) hash()
+            optionID = hashlib.blake2b(f"{city_pairing}-{cabin}-{today_str}".encode(), digest_size=8).hexdigest()
+            formatted_round_trips: list[RoundTrip] = []
             for round_trip in round_trips:
                 if round_trip.outbound is None or round_trip.return_ is None:
-                    state.logger.warning(f"Missing availability for round trip")
+                    logger.warning("Missing availability for round trip")
                     continue
-                outbound = seats_aero_handler.fetch_availability(round_trip.outbound.ID)
-                return_ = seats_aero_handler.fetch_availability(round_trip.return_.ID)
-                state.logger.info(f"Fetched availability for outbound ID: {round_trip.outbound.ID} and return ID: {round_trip.return_.ID}")
+                outbound = get_availability(round_trip.outbound.ID)
+                return_ = get_availability(round_trip.return_.ID)
                 if not outbound or not return_:
+                    logger.warning("No availability fetched for round trip %s/%s", round_trip.outbound.ID, round_trip.return_.ID)
                     continue
 
-                formatted_outbound = TripOption(
-                    release_date=f"{(date.today().strftime('%Y-%m-%d'))}",
-                    trip=format_availability_object(outbound, region)
-                )
+                outbound_trip = format_leg(round_trip.outbound.ID)
+                return_trip = format_leg(round_trip.return_.ID)
 
-                formatted_return = TripOption(
-                    release_date=f"{(date.today().strftime('%Y-%m-%d'))}",
-                    trip=format_availability_object(return_, region)
-                )
-                state.logger.info(f"Formatted availability for outbound ID: {round_trip.outbound.ID} and return ID: {round_trip.return_.ID}")
-
-                if formatted_outbound is None or formatted_return is None:
-                    state.logger.warning(f"Failed to format availability for round trip")
+                if outbound_trip is None or return_trip is None:
+                    logger.warning("Failed to format availability for round trip %s/%s", round_trip.outbound.ID, round_trip.return_.ID)
                     continue
 
+                formatted_outbound = TripOption(release_date=today_str, trip=outbound_trip)
+                formatted_return = TripOption(release_date=today_str, trip=return_trip)
+
                 single_trips.append(formatted_outbound)
                 single_trips.append(formatted_return)
-                state.logger.info(f"Appended formatted single trips for outbound ID: {round_trip.outbound.ID} and return ID: {round_trip.return_.ID}")
-
-                formmatted_round_trips.append(RoundTrip(
-                    outbound=TripOption(
-                        release_date=f"{(date.today().strftime('%Y-%m-%d'))}",
-                        trip=formatted_outbound
-                    ),
-                    return_=TripOption(
-                        release_date=f"{(date.today().strftime('%Y-%m-%d'))}",
-                        trip=formatted_return
-                    ),
+
+                formatted_round_trips.append(RoundTrip(
+                    outbound=formatted_outbound,
+                    return_=formatted_return,
                     OptionID=optionID
                 ))
-                state.logger.info(f"Appended formatted round trip for outbound ID: {round_trip.outbound.ID} and return ID: {round_trip.return_.ID}")
 
-            if len(formmatted_round_trips) == 0:
-                state.logger.warning(f"No valid round trips found for city pairing: {city_pairing}")
+            # Every leg failed: skip the pairing instead of emitting an empty
+            # Route that would only produce useless PDF and sheet rows
+            if not formatted_round_trips:
+                logger.warning("All legs failed for city pairing %s (%s)", city_pairing, cabin.name)
                 continue
 
-            round_relation_trips.extend(formmatted_round_trips)
-            state.logger.info(f"Total formatted round trips so far: {len(round_relation_trips)}")
+            round_relation_trips.extend(formatted_round_trips)
+
+            # Every round trip in a pairing shares the same cities, so the
+            # countries are resolved once from the first outbound leg
+            first_outbound = formatted_round_trips[0].outbound
+            origin_country = iata_country.get(first_outbound.origin_airport, "Unknown")
+            destination_country = iata_country.get(first_outbound.destination_airport, "Unknown")
 
             round_options.append(Route(
                 ID=optionID,
-                roundTrips=formmatted_round_trips,
+                roundTrips=formatted_round_trips,
                 origin_city=city_pairing[0],
                 destination_city=city_pairing[1],
-                origin_country= config.IATA_COUNTRY.get(formmatted_round_trips[0].outbound.origin_airport, "Unknown"),
-                destination_country= config.IATA_COUNTRY.get(formmatted_round_trips[0].outbound.destination_airport, "Unknown"),
-                release_date=f"{(date.today().strftime('%Y-%m-%d'))}",
+                origin_country=origin_country,
+                destination_country=destination_country,
+                release_date=today_str,
                 cabin=cabin.value
             ))
-            state.logger.info(f"Created RoundTripOptions for city pairing: {city_pairing} with {len(formmatted_round_trips)} round trips")
+            logger.info("Formatted %d of %d round trips for city pairing %s (%s)",
+                        len(formatted_round_trips), len(round_trips), city_pairing, cabin.name)
 
-    state.logger.info("Top N round trips formatted successfully")
+    logger.info("Top N round trips formatted successfully: %d routes, %d round trips",
+                len(round_options), len(round_relation_trips))
     state.update_flag('flightsFormatted')
 
-    state.logger.info("Top N round trips shuffled successfully")
-
     return FlightOptions(
         single_trips=single_trips,
         round_trips=round_relation_trips,
         round_options=round_options
     )
 
+def _drain(mapping: dict) -> Iterator[tuple]:
+    """
+    Yield and remove the items of a dict, in insertion order.
+    
+    Handing the filter a drained dict lets each source's raw bulk data be
+    garbage collected as soon as the filter has merged it, instead of all
+    sources staying alive until filtering finishes.
+    
+    Args:
+        mapping (dict): Dict to consume; it is empty afterwards
+        
+    Yields:
+        tuple: (key, value) pairs
+    """
+    while mapping:
+        key = next(iter(mapping))
+        yield key, mapping.pop(key)
+
+def _fetch_bulk_availability_grid(
+        tasks: dict[tuple, dict],
+        max_workers: int = 16,
+        follow_up: Callable[[tuple, list], dict[tuple, dict]] = None
+    ) -> dict[tuple, list]:
+    """
+    Run several bulk availability searches concurrently.
+    
+    All searches share one asynchronous HTTP/2 client on a single event loop
+    (see SeatsAeroHandler.fetch_bulk_availabilities), so the grid costs
+    roughly the slowest search instead of the sum of all of them.
+    
+    Args:
+        tasks (dict[tuple, dict]): fetch_bulk_availability keyword arguments
+            keyed by an identifier chosen by the caller (e.g. (region, source))
+        max_workers (int): Upper bound on concurrent requests to Seats.aero (default: 16)
+        follow_up (Callable[[tuple, list], dict[tuple, dict]], optional): Called
+            with each finished task's key and result; any tasks it returns are
+            started right away, without waiting for the rest of the grid
+        
+    Returns:
+        dict[tuple, list]: Search results keyed like tasks (including follow-up
+            tasks). Failed searches are logged and map to an empty list.
+    """
+    if not tasks:
+        return dict()
+
+    return asyncio.run(seats_aero_handler.fetch_bulk_availabilities(
+        tasks,
+        max_concurrency=min(len(tasks), max_workers),
+        follow_up=follow_up
+    ))
+
+def _prefetch_availability(trip_ids: set[str], availability_cache: dict[str, dict] = None) -> dict[str, dict]:
+    """
+    Fetch detailed availability for a set of trip IDs concurrently.
+
+    Each ID is requested exactly once through the asynchronous Seats.aero
+    client, so the formatting loops can resolve availability with plain dict
+    lookups instead of issuing one blocking request per trip leg.
+
+    Args:
+        trip_ids (set[str]): Unique availability IDs to fetch
+        availability_cache (dict[str, dict], optional): Cache shared across a
+            single pipeline invocation. IDs already present are not fetched
+            again and new results are added to it in place.
+
+    Returns:
+        dict[str, dict]: Availability objects keyed by trip ID. IDs whose
+            request failed map to None, mirroring fetch_availability.
+    """
+    if availability_cache is None:
+        availability_cache = dict()
+
+    trip_ids = {trip_id for trip_id in trip_ids if trip_id not in availability_cache}
+    if not trip_ids:
+        return availability_cache
+
+    try:
+        availability_cache.update(asyncio.run(seats_aero_handler.fetch_availabilities(trip_ids)))
+    except Exception as e:
+        state.logger.error(f"Failed to prefetch availability for {len(trip_ids)} trip IDs. Error: {str(e)}")
+        availability_cache.update(dict.fromkeys(trip_ids))
+
+    state.logger.info(f"Prefetched availability for {len(trip_ids)} unique trip IDs")
+    return availability_cache
+
+
 HEADERS = [
     "Outbound ID", "Return ID", "Origin Airport", "Destination Airport", 
     "Outbound Departure", "Outbound Arrival", "Return Departure", "Return Arrival",
@@ -604,6 +783,20 @@ HEADERS = [
     ]
 
 
+def _result_sheet() -> "SpreadSheet":
+    """
+    Return the results spreadsheet.
+    
+    The Sheets handler caches opened spreadsheets and their worksheets, so
+    only the first call per process issues metadata requests.
+    
+    Returns:
+        SpreadSheet: Spreadsheet identified by config.RESULT_SHEET_ID
+    """
+    from services.google_sheets import handler as sheets_handler
+    return sheets_handler.get_sheet(config.RESULT_SHEET_ID)
+
+
 def broadcast_single_flights(tripOptions: dict[CABIN, list[TripOption]], n: int):
     """
     Generate marketing content, PDFs, store data, and email reports for flight options.
@@ -620,27 +813,138 @@ def broadcast_single_flights(tripOptions: dict[CABIN, list[TripOption]], n: int)
 
     state.logger.info("Starting broadcast of flight options")
     
+    # Same write path as broadcast_round_flights, so the singles tab gets
+    # identical cell types from both pipelines
     rows = [option.to_row() for options in tripOptions.values() for option in options]
-    sheets_handler.get_sheet(config.RESULT_SHEET_ID).get_worksheet('singles').add_rows(rows=rows)
-        
+
+    today = date.today()
+    # PDFs are rendered lazily while the email consumes them; keep track of what
+    # was written so the files are removed even if sending fails halfway.
+    pdfs: list[PDF_OBJ] = []
+    def attachments() -> Iterator[PDF_OBJ]:
+        for pdf in _iter_single_pdfs([option for options in tripOptions.values() for option in options]):
+            pdfs.append(pdf)
+            yield pdf
+
+    # The Sheets write does not depend on the PDFs, so it runs on a worker
+    # thread while the PDFs are rendered and emailed on this one
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        sheets_write = executor.submit(_result_sheet().add_rows_batch, {'singles': _dedupe_rows(rows)})
+
+        #TODO: whatsapp_post no longer exists in TripOption,, figure out a work around. 
+        try:
+            try:
+                # Join the posts once up front rather than inside the body f-string
+                whatsapp_posts = format_whatsapp_posts(
+                    opt.whatsapp_post for opts in tripOptions.values() for opt in opts
+                )
+                email_self(
+                    subject=f"{today} - {today + timedelta(days=n - 1)} Top {n} Combos de Voos Single",
+                    body=f"\
+                        Attached are the top N combos of flights.\n \
+                        Whatsapp Posts:\n \
+                        {whatsapp_posts} \
+                        \n\nThis email was sent automatically by the flight alert system.",
+                    attachments=attachments()
+                )
+                state.update_flag('emailSent')
+            finally:
+                clear_pdfs(*pdfs)
+        except Exception:
+            # The email error is the one raised; a Sheets failure on top of it
+            # is logged rather than lost
+            try:
+                sheets_write.result()
+            except Exception as sheets_error:
+                state.log_exception(sheets_error, context="Google Sheets write")
+            raise
+
+        sheets_write.result()
     state.logger.info("Top N round trips written to Google Sheet successfully")
     state.update_flag('sentToGoogleSheets')
 
-    pdfs = [generate_pdf_for_single_trips(option, option.release_date) for options in tripOptions.values() for option in options]
+# Below this many PDFs, spawning worker processes costs more than it saves
+PARALLEL_PDF_THRESHOLD = 4
+# Target number of task chunks handed to each PDF worker
+PDF_CHUNKS_PER_WORKER = 4
 
-    #TODO: whatsapp_post no longer exists in TripOption,, figure out a work around. 
-    email_self(
-        subject=f"{date.today()} - {date.today() + timedelta(days=n - 1)} Top {n} Combos de Voos Single",
-        body=f"\
-                Attached are the top N combos of flights.\n \
-                Whatsapp Posts:\n \
-                {format_whatsapp_posts(opt.whatsapp_post for opts in tripOptions.values() for opt in opts)} \
-                \n\nThis email was sent automatically by the flight alert system.",
-        attachments=pdfs
-    )
-    state.update_flag('emailSent')
+def _iter_single_pdfs(options: list[TripOption]) -> Iterator[PDF_OBJ]:
+    """
+    Generate one PDF per single trip option, in parallel when worthwhile.
+    
+    PDF rendering is CPU-bound, so larger batches are spread over a process
+    pool; small batches are rendered serially to avoid the process spawn cost.
+    PDFs are yielded as soon as they are ready so the consumer can start
+    working on the first one while the rest are still rendering.
+    
+    Args:
+        options (list[TripOption]): Trip options to render
+        
+    Yields:
+        PDF_OBJ: Generated PDFs, in the same order as options
+        
+    Note:
+        - Titles include the availability ID so every option gets its own file
+          and workers never write to the same path
+    """
+    from logic.pdf_generator import generate_pdf_for_single_trips, DEFAULT_FOLDER as PDF_FOLDER
+
+    titles = [f"{option.release_date} {option.availability_Id}" for option in options]
+
+    workers = min(_usable_cpu_count(), len(options))
+    # Workers are forked so they start with the parent's loaded config and
+    # handlers; spawn/forkserver would re-import those modules unloaded. Where
+    # fork is unavailable (Windows), render serially instead.
+    can_fork = "fork" in multiprocessing.get_all_start_methods()
+    if len(options) < PARALLEL_PDF_THRESHOLD or workers < 2 or not can_fork:
+        for option, title in zip(options, titles):
+            yield generate_pdf_for_single_trips(option, title)
+        return
+
+    # Create the output folder once here rather than racing on it in every worker
+    os.makedirs(PDF_FOLDER, exist_ok=True)
+    # Hand tasks out in chunks to cut per-task IPC, while keeping several
+    # chunks per worker so a slow PDF does not leave the others idle
+    chunksize = max(1, len(options) // (workers * PDF_CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_pdf_worker,
+    ) as executor:
+        yield from executor.map(generate_pdf_for_single_trips, options, titles, chunksize=chunksize)
+
+def _init_pdf_worker():
+    """
+    Process pool initializer: set up the worker's own logger (see
+    GLOBAL_STATE.setup_worker_logger) and import the PDF generator (and fpdf)
+    once per worker, before its first task, instead of inside the first task.
+    """
+    state.setup_worker_logger()
+    import logic.pdf_generator
+
+def _usable_cpu_count() -> int:
+    """
+    Number of CPUs this process may actually run on.
+    
+    Returns:
+        int: CPUs in the scheduler affinity mask where supported (respects
+            container and taskset limits), otherwise os.cpu_count()
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
 
-    clear_pdfs(*pdfs)
+def _dedupe_rows(rows: list[list]) -> list[list]:
+    """
+    Drop repeated rows while keeping the first occurrence order.
+    
+    Args:
+        rows (list[list]): Rows of hashable cell values
+        
+    Returns:
+        list[list]: Unique rows
+    """
+    return list({tuple(row): row for row in rows}.values())
 
 def broadcast_round_flights(options: FlightOptions, n: int) -> None:
     """
@@ -657,23 +961,27 @@ def broadcast_round_flights(options: FlightOptions, n: int) -> None:
     """
     state.logger.info("Starting broadcast of flight options")
 
-    singles_rows = [options.single_trips[i].to_row() for i in range(len(options.single_trips))]
-    singles_rounds_relation_rows = [options.round_trips[i].to_row() for i in range(len(options.round_trips))]
-    round_rows = [options.round_options[i].to_row() for i in range(len(options.round_options))]
-
-    state.logger.info(f"FINISHED Prepared {len(singles_rows)} single trip rows for Google Sheet")
-    state.logger.info(f"FINISHED Prepared {len(singles_rounds_relation_rows)} single-round relation rows for Google Sheet")
-    state.logger.info(f"FINISHED Prepared {len(round_rows)} round trip rows for Google Sheet")
-    
-    sheets_handler.get_sheet(config.RESULT_SHEET_ID).get_worksheet('singles').add_rows(rows=singles_rows)  
-    state.logger.info(f"Added {len(singles_rows)} single trip rows to Google Sheet")
+    # Result tab -> rows, in write order
+    rows_by_tab = {
+        # The same leg shows up in several round trips, so drop repeated rows
+        'singles': _dedupe_rows([trip.to_row() for trip in options.single_trips]),
+        'singles_rounds_relational': _dedupe_rows([round_trip.to_row() for round_trip in options.round_trips]),
+        'rounds': Route.to_rows(options.round_options),
+    }
 
-    sheets_handler.get_sheet(config.RESULT_SHEET_ID).get_worksheet('singles_rounds_relational').add_rows(rows=singles_rounds_relation_rows)
-    state.logger.info(f"Added {len(singles_rounds_relation_rows)} single-round relation rows to Google Sheet")
+    n_singles, n_relations, n_rounds = map(len, rows_by_tab.values())
 
-    sheets_handler.get_sheet(config.RESULT_SHEET_ID).get_worksheet('rounds').add_rows(rows=round_rows)
-    state.logger.info(f"Added {len(round_rows)} round trip rows to Google Sheet")
-    state.logger.info("Top N round trips written to Google Sheet successfully")
+    logger = state.logger
+    if logger.isEnabledFor(logging.DEBUG):
+        for tab, rows in rows_by_tab.items():
+            logger.debug("Prepared %d rows for the %s tab", len(rows), tab)
+    
+    # One batchUpdate request for all three tabs
+    _result_sheet().add_rows_batch(rows_by_tab)
+    logger.info(
+        "Top N round trips written to Google Sheet: %d singles, %d single-round relations, %d rounds",
+        n_singles, n_relations, n_rounds
+    )
     state.update_flag('sentToGoogleSheets')
     '''
     pdfs = [generate_pdf_for_round_trips(option, option.release_date) for option in options]
@@ -707,13 +1015,13 @@ def clear_round(options: list[Route]) -> None:
         
     Returns:
         None
+        
+    Note:
+        - Deletion runs on a background thread; the call returns immediately
     """
     state.logger.info("Cleaning up temporary files")
 
-    for option in options:
-        for image in option.images:
-            if image and image.filePath and os.path.exists(image.filePath):
-                os.remove(image.filePath)
+    _cleanup_in_background(_remove_images, [image.filePath for option in options for image in option.images if image and image.filePath])
 
     return
 
@@ -729,16 +1037,100 @@ def clear_single(options: list[TripOption]) -> None:
 
     Returns:
         None
+
+    Note:
+        - Deletion runs on a background thread; the call returns immediately
     """
     state.logger.info("Cleaning up temporary files for single trips")
 
-    for option in options:
-        for image in option.images:
-            if image and image.filePath and os.path.exists(image.filePath):
-                os.remove(image.filePath)
+    _cleanup_in_background(_remove_images, [image.filePath for option in options for image in option.images if image and image.filePath])
 
     return
 
+UNLINK_WORKERS = 16
+
+def _safe_unlink(path: str) -> None:
+    """
+    Delete a file, ignoring files that are already gone.
+    
+    Args:
+        path (str): Path of the file to delete
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _unlink_all(paths: list[str]) -> None:
+    """
+    Delete many files concurrently.
+    
+    Removals are independent blocking syscalls, so they are fanned out to a
+    thread pool instead of being issued one after another.
+    
+    Args:
+        paths (list[str]): Paths of the files to delete
+    """
+    if not paths:
+        return
+    with ThreadPoolExecutor(max_workers=min(UNLINK_WORKERS, len(paths))) as executor:
+        # Consume the iterator so any unexpected error (e.g. permissions) surfaces here
+        list(executor.map(_safe_unlink, paths))
+
+def _remove_images(paths: list[str]) -> None:
+    """
+    Delete downloaded images, a whole folder at a time where possible.
+    
+    fetch_image saves every query into its own folder under IMAGES_FOLDER,
+    so those folders are removed with one rmtree each. Images saved
+    directly in IMAGES_FOLDER (or anywhere else) are unlinked one by one.
+    
+    Args:
+        paths (list[str]): Paths of the images to delete
+    """
+    root = os.path.normpath(IMAGES_FOLDER)
+    folders = set()
+    loose = []
+    for path in paths:
+        folder = os.path.dirname(os.path.normpath(path))
+        if os.path.dirname(folder) == root:
+            folders.add(folder)
+        else:
+            loose.append(path)
+
+    for folder in folders:
+        shutil.rmtree(folder, ignore_errors=True)
+    _unlink_all(loose)
+
+# Single worker, so deletions run in order; shut down (waiting for queued
+# deletions) at interpreter exit so a shutdown doesn't leave files behind
+_cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cleanup")
+atexit.register(_cleanup_executor.shutdown, wait=True)
+
+def _cleanup_in_background(remove: Callable[[list[str]], None], paths: list[str]) -> None:
+    """
+    Delete temporary files on the background cleanup worker.
+    
+    Nothing downstream waits on temporary files being gone, so callers hand
+    the paths off and return without blocking on disk I/O. Pending deletions
+    are finished before the process exits.
+    
+    Args:
+        remove (Callable[[list[str]], None]): Deletion routine to run, e.g.
+            _remove_images or _unlink_all
+        paths (list[str]): Paths of the files to delete
+    """
+    if not paths:
+        return
+
+    def run() -> None:
+        try:
+            remove(paths)
+        except Exception as e:
+            state.logger.error(f"Failed to clean up temporary files: {e}")
+
+    _cleanup_executor.submit(run)
+
 def clear_pdfs(*pdfs: PDF_OBJ) -> None:
     """
     Clean up temporary PDF files used in the flight alert process.
@@ -751,14 +1143,32 @@ def clear_pdfs(*pdfs: PDF_OBJ) -> None:
         
     Returns:
         None
+        
+    Note:
+        - Deletion runs on a background thread; the call returns immediately
     """
     state.logger.info("Cleaning up temporary PDF files")
     
-    for pdf in pdfs:
-        if pdf and pdf.filePath and os.path.exists(pdf.filePath):
-            os.remove(pdf.filePath)
+    _cleanup_in_background(_unlink_all, [pdf.filePath for pdf in pdfs if pdf and pdf.filePath])
     
     return
 
-def format_whatsapp_posts(posts: list[str]) -> str:
-        return "\n\n".join(posts)
\ No newline at end of file
+def format_whatsapp_posts(posts: Iterable[str]) -> str:
+    """
+    Join WhatsApp posts into a single block of text for the email body.
+    
+    Args:
+        posts (Iterable[str]): WhatsApp posts to join
+        
+    Returns:
+        str: Posts separated by blank lines
+        
+    Note:
+        - Empty and single-post sequences are returned without joining
+    """
+    if isinstance(posts, (list, tuple)):
+        if not posts:
+            return ""
+        if len(posts) == 1:
+            return posts[0]
+    return "\n\n".join(posts)
\ No newline at end of file
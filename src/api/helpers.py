@@ -1,6 +1,11 @@
+from functools import lru_cache
+
 from data_types.enums import REGION, CABIN
 
-from global_state import state
+# Value -> member tables, built once so request parameters resolve with a
+# plain dict lookup. Members map to themselves, as REGION(member) would.
+_REGION_LOOKUP: dict = {key: region for region in REGION for key in (region.value, region)}
+_CABIN_LOOKUP: dict = {key: cabin for cabin in CABIN for key in (cabin.value, cabin)}
 
 def convert_region_to_enum(region: str) -> REGION:
     """
@@ -15,10 +20,10 @@ def convert_region_to_enum(region: str) -> REGION:
     Raises:
         ValueError: If the region string is invalid.
     """
-    try:
-        return REGION(region)
-    except ValueError as e:
-        raise ValueError(f"Invalid region provided: {e}")
+    member = _REGION_LOOKUP.get(region)
+    if member is None:
+        raise ValueError(f"Invalid region provided: {region!r} is not a valid REGION")
+    return member
     
 def convert_cabins_list_to_enum(cabins: list[str]) -> list[CABIN]:
     """
@@ -33,10 +38,16 @@ def convert_cabins_list_to_enum(cabins: list[str]) -> list[CABIN]:
     Raises:
         ValueError: If any cabin string is invalid.
     """
-    try:
-        return [CABIN(cabin) for cabin in cabins] if cabins else []
-    except ValueError as e:
-        raise ValueError(f"Invalid cabin class provided: {e}")
+    if not cabins:
+        return []
+
+    members: list[CABIN] = []
+    for cabin in cabins:
+        member = _CABIN_LOOKUP.get(cabin)
+        if member is None:
+            raise ValueError(f"Invalid cabin class provided: {cabin!r} is not a valid CABIN")
+        members.append(member)
+    return members
     
 
 def convert_cabins_str_to_enum(cabins: str) -> list[CABIN]:
@@ -48,11 +59,19 @@ def convert_cabins_str_to_enum(cabins: str) -> list[CABIN]:
     
     Returns:
         list[CABIN]: List of corresponding CABIN enums, or empty list if input is None.
+    
+    Note:
+        Comma-separated strings are parsed once and cached, since the same few
+        cabin combinations come in on every request.
     """
-    cabinAsCABIN: list[CABIN] = []
-    if cabins:
-        state.logger.info(f"Converting cabins '{cabins}' to CABIN enum")
-        cabinsList = cabins.split(",") if isinstance(cabins, str) else cabins
-        cabinAsCABIN = convert_cabins_list_to_enum(cabinsList)
-        
-    return cabinAsCABIN
\ No newline at end of file
+    if not cabins:
+        return []
+
+    if isinstance(cabins, str):
+        return list(_parse_cabins_str(cabins))
+    return convert_cabins_list_to_enum(cabins)
+
+@lru_cache(maxsize=256)
+def _parse_cabins_str(cabins: str) -> tuple[CABIN, ...]:
+    # Tuple so the cached value cannot be mutated by a caller
+    return tuple(convert_cabins_list_to_enum(cabins.split(",")))
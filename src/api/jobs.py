@@ -0,0 +1,115 @@
+"""
+Background job queue for the alert pipeline endpoints.
+
+A full pipeline run (fetch, filter, format, PDFs, Sheets and email) takes
+minutes, which is longer than most HTTP gateways keep a request open. The
+endpoints therefore submit the run here and answer immediately with a job ID
+that can be polled through the job status endpoint.
+
+Runs execute one at a time on a single worker thread: the pipeline reports its
+progress through the shared global state (flags, logger), so two concurrent
+runs would overwrite each other's state.
+"""
+
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from global_state import state
+
+# Finished jobs beyond this many are forgotten, oldest first
+MAX_TRACKED_JOBS = 100
+
+
+class JobQueue:
+    """
+    In-process queue that runs submitted callables in the background and
+    keeps track of their status and result.
+
+    Job statuses go from "queued" to "running" and end as "finished" (the
+    callable returned; its return value is the job result) or "failed" (the
+    callable raised; the error message is the job result).
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, fn: Callable[..., Any], *args, **kwargs) -> str:
+        """
+        Queue a callable to run in the background.
+
+        Args:
+            name (str): Human-readable job name, reported back in the job status
+            fn (Callable): Callable to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            str: ID of the queued job
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "name": name,
+                "status": "queued",
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "result": None,
+            }
+            self._prune()
+
+        self._executor.submit(self._run, job_id, fn, *args, **kwargs)
+        state.logger.info("Queued job %s (%s)", job_id, name)
+        return job_id
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """
+        Get a snapshot of a job's status.
+
+        Args:
+            job_id (str): ID returned by submit
+
+        Returns:
+            dict | None: Copy of the job record, or None if the job is unknown
+                or has been forgotten
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def _run(self, job_id: str, fn: Callable[..., Any], *args, **kwargs):
+        self._update(job_id, status="running", started_at=time.time())
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            state.log_exception(e, context=f"job {job_id}")
+            self._update(job_id, status="failed", finished_at=time.time(), result=str(e))
+            return
+        self._update(job_id, status="finished", finished_at=time.time(), result=result)
+        state.logger.info("Job %s finished", job_id)
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def _prune(self):
+        # Caller holds the lock. Only jobs that are done are dropped, so a
+        # queued or running job can always be polled.
+        excess = len(self._jobs) - MAX_TRACKED_JOBS
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job["status"] in ("finished", "failed")][:excess]:
+            del self._jobs[job_id]
+
+
+jobs = JobQueue()
@@ -1,41 +1,166 @@
-from fastapi import APIRouter
+from functools import lru_cache
+from typing import Annotated
+
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from config import config
 from global_state import state
-from alerts_runner import GET_round_from_region_to_region, GET_round_from_country_to_world, GET_single_from_country_to_world
 
-from api.helpers import convert_region_to_enum, convert_cabins_str_to_enum
+from api.helpers import convert_cabins_str_to_enum
+from api.jobs import jobs
 
 from data_types.enums import REGION, CABIN
 
 from services.email import email_self, email
 from services.clickmassa import clickmassa_handler
 
+# The pipeline (alerts_runner -> logic.filter) pulls in pandas and numpy, tens
+# of MB and a few hundred ms of imports. It is imported inside each job's run()
+# instead, so workers boot and answer /health without it and the first job pays
+# the import cost on the job thread rather than the event loop.
+
 router = APIRouter()
 
-@router.get("/health")
-def health_check():
+def _respond(status_code: int, **content) -> ORJSONResponse:
+    """
+    Build a JSON response whose HTTP status matches the status_code field.
+    
+    The body keeps its status_code field so existing clients that read it
+    keep working, while the HTTP status now reflects it too.
+    
+    Args:
+        status_code (int): HTTP status code
+        **content: Remaining fields of the response body
+        
+    Returns:
+        ORJSONResponse: The response, serialized with orjson
+    """
+    return ORJSONResponse(content={"status_code": status_code, **content}, status_code=status_code)
+
+def _static_response(status_code: int, message: str) -> Response:
+    """
+    Build a constant JSON response once, to be returned as-is on every request.
+    
+    Same body as _respond(status_code, message=message), serialized up front
+    so the constant error and acknowledgement paths skip encoding entirely.
+    
+    Args:
+        status_code (int): HTTP status code
+        message (str): Response message
+        
+    Returns:
+        Response: Prebuilt response; it must not be mutated by callers
+    """
+    return Response(
+        content=orjson.dumps({"status_code": status_code, "message": message}),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+_JOB_NOT_FOUND = _static_response(404, "Job not found.")
+_CLICKMASSA_OK = _static_response(200, "ClickMassa message alert processed successfully.")
+_CLICKMASSA_NO_MESSAGE = _static_response(400, "Message not found in the request.")
+_CLICKMASSA_NO_EMAIL = _static_response(400, "User email not found.")
+_INTERNAL_ERROR = _static_response(500, "Internal server error. Please try again later.")
+
+# Identical pipeline requests (same endpoint and query string) made within this
+# many seconds of each other share one job instead of re-running the pipeline,
+# which would otherwise send the same alerts and emails twice.
+DUPLICATE_JOB_TTL = 300
+_recent_jobs: TTLCache = TTLCache(maxsize=512, ttl=DUPLICATE_JOB_TTL)
+
+def _is_reusable(job: dict | None) -> bool:
+    """
+    Whether a previously queued job can stand in for an identical new request.
+    
+    Queued, running and successful jobs are reused; failed runs (raised, or
+    returned a non-2xx status) are not, so a retry actually runs the pipeline.
+    The pipeline reports its status under "status_code" or "status" depending
+    on the endpoint, so both are checked.
+    """
+    if job is None or job["status"] == "failed":
+        return False
+    result = job["result"]
+    if not isinstance(result, dict):
+        return True
+    status = result.get("status_code", result.get("status", 200))
+    return isinstance(status, int) and 200 <= status < 300
+
+def _queue_job(request: Request, name: str, run) -> ORJSONResponse:
+    """
+    Queue a pipeline run and answer 202 Accepted right away.
+    
+    Args:
+        request (Request): Incoming request, used to build the job status URL
+        name (str): Job name reported by the job status endpoint
+        run (Callable[[], dict]): Pipeline run to execute in the background
+        
+    Returns:
+        ORJSONResponse: 202 response with the job ID in the body and the job
+            status URL in the Location header. An identical request made less
+            than DUPLICATE_JOB_TTL seconds ago gets the existing job back.
+    """
+    # Requests run on the event loop thread, so the lookup and insert below
+    # cannot interleave with another request.
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+    job_id = _recent_jobs.get(key)
+    if job_id is not None and _is_reusable(jobs.get(job_id)):
+        state.logger.info("Reusing job %s for duplicate %s request", job_id, name)
+    else:
+        job_id = jobs.submit(name, run)
+        _recent_jobs[key] = job_id
+    response = _respond(202, message="Alerts runner queued.", job_id=job_id)
+    response.headers["Location"] = str(request.url_for("get_job_status", job_id=job_id))
+    return response
+
+def _send_email_in_background(**kwargs):
+    """
+    Send an email from a background task, logging failures instead of raising.
+    
+    Background tasks run after the response has been sent, so an exception
+    could no longer reach the client and would only clutter the server log.
+    
+    Args:
+        **kwargs: Arguments for services.email.email
+    """
+    try:
+        email(**kwargs)
+    except Exception as e:
+        state.logger.error("Failed to send email in the background: %s", e)
+
+@router.get("/health", response_model=None)
+async def health_check():
     """
     Health check endpoint to verify API status.
     
     Returns a simple JSON response indicating the API is running.
     
     Returns:
-        dict: A dictionary with a message indicating the API is healthy.
+        Response: JSON body with a message indicating the API is healthy.
     """
-    return {"status": "API is running", "version": config.VERSION}
-
-@router.get("/round-from-region-to-region")
-def get_from_region_to_region(
-    origin: str = None, 
-    destination: str = None, 
-    start_date: str = None, 
-    end_date: str = None, 
-    cabins: str = None, 
-    min_return_days: int = 1, 
-    max_return_days: int = 60,
-    n: int = 1,
-    deepness: int = 1
+    return Response(content=_health_body(), media_type="application/json")
+
+@lru_cache(maxsize=1)
+def _health_body() -> bytes:
+    # Serialized on the first probe rather than at import, since routes are
+    # imported before config.load() sets VERSION; it never changes afterwards
+    return orjson.dumps({"status": "API is running", "version": config.VERSION})
+
+@router.get("/round-from-region-to-region", response_model=None)
+async def get_from_region_to_region(
+    request: Request,
+    origin: Annotated[REGION, Query()],
+    destination: Annotated[REGION, Query()],
+    start_date: Annotated[str | None, Query()] = None,
+    end_date: Annotated[str | None, Query()] = None,
+    cabins: Annotated[str | None, Query()] = None,
+    min_return_days: Annotated[int, Query(ge=0)] = 1,
+    max_return_days: Annotated[int, Query(ge=0)] = 60,
+    n: Annotated[int, Query(ge=1)] = 1,
+    deepness: Annotated[int, Query(ge=1)] = 1
     ):
     """
     Endpoint to trigger the flight alert pipeline execution.
@@ -44,8 +169,8 @@ def get_from_region_to_region(
     fetching flight data, processing alerts, and sending notifications.
 
     Args:
-        origin (str): Origin city or region for the flight search
-        destination (str): Destination city or region for the flight search 
+        origin (REGION): Origin region for the flight search, by name (e.g. "South America")
+        destination (REGION): Destination region for the flight search, by name
         source (str): Airline source to filter results (optional)
         start_date (str): Start date for the flight search in YYYY-MM-DD format (optional
         end_date (str): End date for the flight search in YYYY-MM-DD format (optional)
@@ -58,66 +183,59 @@ def get_from_region_to_region(
     Returns:
         dict: A dictionary containing the status of the operation and any relevant messages.
     """
-    if origin is None or destination is None:
-        return {"status_code": 400, "message": "Origin and destination must be specified."}
-
-    try:
-        # Convert origin and destination to REGION enum
-        state.logger.info(f"Converting origin '{origin}' and destination '{destination}' to REGION enum")
-        originAsREGION: REGION = convert_region_to_enum(origin)
-        destinationAsREGION: REGION = convert_region_to_enum(destination)
-    except ValueError as e:
-        state.logger.error(f"Invalid region provided: {e}")
-        return {"status_code": 400, "message": f"Invalid region provided: {e}"}
-
     cabinAsCABIN: list[CABIN] = []
     if cabins:
         try:  
             cabinAsCABIN = convert_cabins_str_to_enum(cabins)
         except ValueError as e:
-            state.logger.error(f"Invalid cabin class provided: {e}")
-            return {"status_code": 400, "message": f"Invalid cabin class provided: {e}"}
+            state.logger.error("Invalid cabin class provided: %s", e)
+            return _respond(400, message=f"Invalid cabin class provided: {e}")
  
     
     
-    try:
-        response = GET_round_from_region_to_region(
-            origin=originAsREGION,
-            destination=destinationAsREGION,
-            start_date=start_date,
-            end_date=end_date,
-            cabins=cabinAsCABIN,
-            min_return_days=min_return_days,
-            max_return_days=max_return_days,
-            n=n,
-            deepness=deepness
-        )
-        state.logger.info("Alerts runner executed successfully.")
-        if response.status_code != 200:
-           raise ValueError(f"Alerts runner failed with status code: {response}")
+    def run() -> dict:
+        from alerts_runner import GET_round_from_region_to_region
+        try:
+            response = GET_round_from_region_to_region(
+                origin=origin,
+                destination=destination,
+                start_date=start_date,
+                end_date=end_date,
+                cabins=cabinAsCABIN,
+                min_return_days=min_return_days,
+                max_return_days=max_return_days,
+                n=n,
+                deepness=deepness
+            )
+            state.logger.info("Alerts runner executed successfully.")
+            if response.status_code != 200:
+               raise ValueError(f"Alerts runner failed with status code: {response}")
         
-        state.logger.info("Alerts runner completed successfully.")
-    except Exception as e:
-        state.log_exception(e)
-        email_self(
-            subject="Error in Alerts Runner",
-            body=f"An error occurred while running the alerts: {e}\nCurrent state: {state}",
-        )
-        print(f"Error occurred: {e}")
-        return {"status_code": 500, "message": str(e)}
-
-    return {"status_code": 200, "message": "Alerts runner executed successfully."}
-
-@router.get("/round-from-country-to-world")
-def get_from_country_to_world(
-    country: str = None, # Needs to be a country code
-    start_date: str = None, 
-    end_date: str = None, 
-    cabin: str = None, 
-    min_return_days: int = 1, 
-    max_return_days: int = 60,
-    n: int = 1,
-    deepness: int = 1
+            state.logger.info("Alerts runner completed successfully.")
+        except Exception as e:
+            state.log_exception(e)
+            email_self(
+                subject="Error in Alerts Runner",
+                body=f"An error occurred while running the alerts: {e}\nCurrent state: {state}",
+            )
+            print(f"Error occurred: {e}")
+            return {"status_code": 500, "message": str(e)}
+
+        return {"status_code": 200, "message": "Alerts runner executed successfully."}
+
+    return _queue_job(request, "round-from-region-to-region", run)
+
+@router.get("/round-from-country-to-world", response_model=None)
+async def get_from_country_to_world(
+    request: Request,
+    country: Annotated[str, Query(min_length=2, max_length=2)], # Needs to be a country code
+    start_date: Annotated[str | None, Query()] = None,
+    end_date: Annotated[str | None, Query()] = None,
+    cabin: Annotated[CABIN | None, Query()] = None,
+    min_return_days: Annotated[int, Query(ge=0)] = 1,
+    max_return_days: Annotated[int, Query(ge=0)] = 60,
+    n: Annotated[int, Query(ge=1)] = 1,
+    deepness: Annotated[int, Query(ge=1)] = 1
 ):
     """
     Endpoint to trigger the flight alert pipeline execution for a country to world search.
@@ -129,7 +247,7 @@ def get_from_country_to_world(
         country (str): Country for the flight search
         start_date (str): Start date for the flight search in YYYY-MM-DD format (optional)
         end_date (str): End date for the flight search in YYYY-MM-DD format (optional)
-        cabins (list[str]): List of cabin classes to filter results (optional)
+        cabin (CABIN): Cabin class to filter results, by value (e.g. "business") (optional)
         min_return_days (int): Minimum number of days for return flight (default: 1)
         max_return_days (int): Maximum number of days for return flight (default: 60)
         n (int): Number of top results to return (default: 1)
@@ -138,49 +256,44 @@ def get_from_country_to_world(
     Returns:
         dict: A dictionary containing the status of the operation and any relevant messages.
     """
-    if country is None:
-        return {"status_code": 400, "message": "Country must be specified."}
 
-    cabinAsCABIN: CABIN = None
-    if cabin:
-        try:  
-           cabinAsCABIN = CABIN(cabin)
-        except ValueError as e:
-            state.logger.error(f"Invalid cabin class provided: {e}")
-            return {"status_code": 400, "message": 'Internal server error. Please try again later.'}
-        
-    try:
-        response = GET_round_from_country_to_world(
-            country=country,
-            start_date=start_date,
-            end_date=end_date,
-            cabin=cabinAsCABIN,
-            min_return_days=min_return_days,
-            max_return_days=max_return_days,
-            n=n,
-            deepness=deepness
-        )
-        state.logger.info("Alerts runner executed successfully.")
+    def run() -> dict:
+        from alerts_runner import GET_round_from_country_to_world
+        try:
+            response = GET_round_from_country_to_world(
+                country=country,
+                start_date=start_date,
+                end_date=end_date,
+                cabin=cabin,
+                min_return_days=min_return_days,
+                max_return_days=max_return_days,
+                n=n,
+                deepness=deepness
+            )
+            state.logger.info("Alerts runner executed successfully.")
 
-        return response
+            return response
 
-    except Exception as e:
-        state.log_exception(e)
-        email_self(
-            subject="Error in Alerts Runner",
-            body=f"An error occurred while running the alerts: {e}\nCurrent state: {state}"
-        )
-        print(f"Error occurred: {e}")
-        return {"status_code": 500, "message": 'Internal server error. Please try again later.'}
-
-@router.get('/single-from-country-to-world')
-def get_single_from_country_to_world(
-    country: str = None, # Needs to be a country code
-    start_date: str = None, 
-    end_date: str = None, 
-    cabins: list[str] = None, 
-    n: int = 1,
-    deepness: int = 1
+        except Exception as e:
+            state.log_exception(e)
+            email_self(
+                subject="Error in Alerts Runner",
+                body=f"An error occurred while running the alerts: {e}\nCurrent state: {state}"
+            )
+            print(f"Error occurred: {e}")
+            return {"status_code": 500, "message": 'Internal server error. Please try again later.'}
+
+    return _queue_job(request, "round-from-country-to-world", run)
+
+@router.get('/single-from-country-to-world', response_model=None)
+async def get_single_from_country_to_world(
+    request: Request,
+    country: Annotated[str, Query(min_length=2, max_length=2)], # Needs to be a country code
+    start_date: Annotated[str | None, Query()] = None,
+    end_date: Annotated[str | None, Query()] = None,
+    cabins: Annotated[list[str] | None, Query()] = None,
+    n: Annotated[int, Query(ge=1)] = 1,
+    deepness: Annotated[int, Query(ge=1)] = 1
 ):
     '''
     Endpoint to trigger the flight alert pipeline execution for a country to world search.
@@ -200,82 +313,102 @@ def get_single_from_country_to_world(
         dict: A dictionary containing the status of the operation and any relevant messages.
     
     '''
-    if country is None:
-        return {"status_code": 400, "message": "Country must be specified."}
     
     cabinAsCABIN: list[CABIN] = []
     if cabins:
         try:  
             cabinAsCABIN = convert_cabins_str_to_enum(cabins)
         except ValueError as e:
-            state.logger.error(f"Invalid cabin class provided: {e}")
-            return {"status_code": 400, "message": 'Internal server error. Please try again later.'}
+            state.logger.error("Invalid cabin class provided: %s", e)
+            return _respond(400, message=f"Invalid cabin class provided: {e}")
         
-    try:
-        response = GET_single_from_country_to_world(
-            country=country,
-            start_date=start_date,
-            end_date=end_date,
-            cabins=cabinAsCABIN,
-            n=n,
-            deepness=deepness,
-        )
-        state.logger.info("Alerts runner executed successfully.")
+    def run() -> dict:
+        from alerts_runner import GET_single_from_country_to_world
+        try:
+            response = GET_single_from_country_to_world(
+                country=country,
+                start_date=start_date,
+                end_date=end_date,
+                cabins=cabinAsCABIN,
+                n=n,
+                deepness=deepness,
+            )
+            state.logger.info("Alerts runner executed successfully.")
         
-        return response
-    except Exception as e:
-        state.log_exception(e)
-        email_self(
-            subject="Error in Alerts Runner",
-            body=f"An error occurred while running the alerts: {e}\nCurrent state: {state}"
-        )
-        print(f"Error occurred: {e}")
-        return {"status_code": 500, "message": 'Internal server error. Please try again later.'}
-    finally:
-        state.logger.info("Alerts runner finished.")
+            return response
+        except Exception as e:
+            state.log_exception(e)
+            email_self(
+                subject="Error in Alerts Runner",
+                body=f"An error occurred while running the alerts: {e}\nCurrent state: {state}"
+            )
+            print(f"Error occurred: {e}")
+            return {"status_code": 500, "message": 'Internal server error. Please try again later.'}
+        finally:
+            state.logger.info("Alerts runner finished.")
+
+    return _queue_job(request, "single-from-country-to-world", run)
 
+@router.get("/jobs/{job_id}", response_model=None)
+async def get_job_status(job_id: str):
+    """
+    Endpoint to poll a queued alert pipeline run.
+
+    The alert endpoints run the pipeline in the background and answer with a
+    job ID right away; this endpoint reports how that run is going.
 
-@router.post("/clickmassa-message-alert")
-def clickmassa_message_alert(
-    request: dict
+    Args:
+        job_id (str): Job ID returned by one of the alert endpoints
+
+    Returns:
+        dict: The job status ("queued", "running", "finished" or "failed"),
+            timestamps and, once done, the pipeline's response or error message.
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        return _JOB_NOT_FOUND
+    return _respond(200, **job)
+
+
+@router.post("/clickmassa-message-alert", response_model=None)
+async def clickmassa_message_alert(
+    request: dict,
+    background_tasks: BackgroundTasks
 ):
     try:
-        state.logger.info(f"ClickMassa message alert triggered.")
+        state.logger.info("ClickMassa message alert triggered.")
 
-        message = request.get('message', {})
+        message = request.get('message')
 
-        if not message:
+        if not isinstance(message, dict) or not message:
             state.logger.warning("Message not found in the request.")
-            return {"status_code": 400, "message": "Message not found in the request."}
+            return _CLICKMASSA_NO_MESSAGE
 
         fromMe = message.get('fromMe', False)
         if fromMe:
             state.logger.info("Message is from the user, ignoring it.")
-            return {"status_code": 200, "message": "ClickMassa message alert processed successfully."}
+            return _CLICKMASSA_OK
 
-        ticket = message.get('ticket', "Unknown")
-        if ticket == "Unknown":
-            state.logger.warning("User ID not found in the message.")
-            return {"status_code": 400, "message": "User ID not found in the message."}
-        
-        user = ticket.get('user', "Unknown")
-        if user == "Unknown":
-            state.logger.warning("User not found in the ticket.")
-            return {"status_code": 400, "message": "User not found in the ticket."}
+        # message.ticket.user.email, where any level may be missing or not an object
+        try:
+            user_email = message['ticket']['user']['email']
+        except (KeyError, TypeError):
+            user_email = None
 
-        user_email = user.get('email', None)
         if not user_email:
-            state.logger.warning("User email not found.")
-            return {"status_code": 400, "message": "User email not found."}
+            state.logger.warning("User email not found in the message ticket.")
+            return _CLICKMASSA_NO_EMAIL
         
-        email(
+        # Acknowledge the webhook right away; the email is sent after the response
+        background_tasks.add_task(
+            _send_email_in_background,
             subject="ALERTA DE MENSAGEM CLICKMASSA",
             body=f"Nova mensagem recebida.\nVerifique o clickmassa assim que puder",
             to=user_email
         )
 
         state.logger.info("ClickMassa message alert processed successfully.")
-        return {"status_code": 200, "message": "ClickMassa message alert processed successfully."}
+        return _CLICKMASSA_OK
     except Exception as e:
-        state.logger.error(f"Failed to process ClickMassa message alert: {e}")
-        return {"status_code": 500, "message": "Internal server error. Please try again later."}
\ No newline at end of file
+        state.logger.error("Failed to process ClickMassa message alert: %s", e)
+        return _INTERNAL_ERROR
\ No newline at end of file
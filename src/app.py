@@ -1,5 +1,6 @@
 import fastapi
+from fastapi.responses import ORJSONResponse
 from api.routes import router
 
-APP = fastapi.FastAPI()
-APP.include_router(router, prefix="/api", tags=["Flight Alerts"])
\ No newline at end of file
+APP = fastapi.FastAPI(default_response_class=ORJSONResponse)
+APP.include_router(router, prefix="/api", tags=["Flight Alerts"])
@@ -31,8 +31,15 @@ Configuration Categories:
 """
 
 import os
-import pandas as pd
-import json
+import csv
+import orjson
+import pickle
+import tempfile
+from types import MappingProxyType
+
+AIRPORTS_FILE = "data/airports.csv"
+# Parsed airport mappings, rebuilt whenever the CSV changes
+AIRPORTS_CACHE_FILE = "data/airports.cache.pkl"
 
 
 class Config:
@@ -62,6 +69,7 @@ class Config:
             CURRENCY_SYMBOL (str): Currency symbol (e.g., 'R$', '$')
             COMMISSION (int): Commission amount in cents
             CREDIT_CARD_FEE (int): Credit card fee in cents
+            PRIME_CURRENCIES (list[str]): Currencies whose exchange rates are fetched at startup
             
         API Credentials:
             OPENAI_API_KEY (str): OpenAI API key for content generation
@@ -76,6 +84,7 @@ class Config:
         Data Mappings:
             IATA_CITY (dict): Mapping from IATA codes to city names
             CITY_COUNTRY (dict): Mapping from city names to country codes
+            IATA_PLACE (dict): Mapping from IATA codes to (city, country) tuples
     """
     
     def __init__(self):
@@ -85,7 +94,7 @@ class Config:
         Creates an empty configuration instance. The actual configuration
         loading happens when the load() method is called.
         """
-        pass
+        self._loaded = False
 
     def load(self):
         """
@@ -164,8 +173,14 @@ class Config:
             - Validates all enum values against their definitions
             - Creates airport mappings from CSV data
             - Ensures all required API credentials are present
+            - Only the first successful call does any work; later calls return
+              immediately
+            - Airport mappings are exposed as read-only MappingProxyType views
             - Sets reasonable defaults for optional parameters
         """
+        if self._loaded:
+            return
+
         if os.getenv("MODE") != "production":
             print("Loading environment variables from .env file...")
             from dotenv import load_dotenv
@@ -180,17 +195,19 @@ class Config:
         self.CURRENCY_SYMBOL = os.getenv("CURRENCY_SYMBOL", "$")
         self.COMMISSION = int(os.getenv("COMMISSION", 0))  # Note: COMISSION in .env (typo)
         self.CREDIT_CARD_FEE = int(os.getenv("CREDIT_CARD_FEE", 0))
+        # Exchange rates fetched at startup, e.g. "USD,EUR,GBP"
+        self.PRIME_CURRENCIES = [code.strip().upper() for code in os.getenv("PRIME_CURRENCIES", "").split(",") if code.strip()]
 
         # Secrets
         service_account_str = os.getenv("GOOGLE_SERVICE_ACCOUNT", "{}")
         #print(f"Service account string length: {len(service_account_str)}")
         try:
             if service_account_str and service_account_str != "{}":
-                self.GOOGLE_SERVICE_ACCOUNT = json.loads(service_account_str)
+                self.GOOGLE_SERVICE_ACCOUNT = orjson.loads(service_account_str)
             else:
                 print("Warning: GOOGLE_SERVICE_ACCOUNT is empty or default")
                 self.GOOGLE_SERVICE_ACCOUNT = None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Error parsing GOOGLE_SERVICE_ACCOUNT JSON: {e}")
             self.GOOGLE_SERVICE_ACCOUNT = None
         self.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -209,24 +226,15 @@ class Config:
 
         # Mappings
 
-        df = pd.read_csv("data/airports.csv")
-        df = df[["municipality", "iata_code", "iso_country", "latitude_deg", "longitude_deg", "continent"]]
-        df = df.rename(columns={
-            "municipality": "City",
-            "iata_code": "IATA",
-            "iso_country": "Country",
-            "latitude_deg": "Latitude",
-            "longitude_deg": "Longitude",
-            "continent": "Region"
-        })
-
-        # Create dictionaries for IATA to City and City to Country
-
-        self.IATA_CITY = df.set_index("IATA")["City"].to_dict()
-        self.IATA_COUNTRY = df.set_index("IATA")["Country"].to_dict()
-        self.IATA_LATITUDE = df.set_index("IATA")["Latitude"].to_dict()
-        self.IATA_LONGITUDE = df.set_index("IATA")["Longitude"].to_dict()
-        self.COUNTRY_REGION = df.set_index("Country")["Region"].to_dict()
+        (
+            self.IATA_CITY,
+            self.IATA_COUNTRY,
+            self.IATA_LATITUDE,
+            self.IATA_LONGITUDE,
+            self.COUNTRY_REGION,
+            # City and country together, so callers that need both do one lookup
+            self.IATA_PLACE,
+        ) = map(MappingProxyType, load_airport_mappings(AIRPORTS_FILE))
         
         # Assert required environment variables
         assert_env_vars(
@@ -259,6 +267,8 @@ class Config:
         else:
             print("✅ Google Service Account loaded successfully")
 
+        self._loaded = True
+
 
 def assert_env_vars(*vars):
     """
@@ -291,6 +301,88 @@ def assert_env_vars(*vars):
         if not var[1]:
             raise ValueError(f"Missing required environment variable: {var[0]}")
 
+
+def load_airport_mappings(csv_path: str = AIRPORTS_FILE, cache_path: str = AIRPORTS_CACHE_FILE) -> tuple[dict, ...]:
+    """
+    Build the airport lookup tables from the OurAirports CSV.
+    
+    The CSV is parsed with the standard library csv module, and the resulting
+    mappings are pickled to cache_path together with the CSV's size and
+    modification time, so later boots load them directly as long as the CSV
+    has not changed.
+    
+    Args:
+        csv_path (str): Path to the airports CSV file
+        cache_path (str): Path of the pickle cache
+        
+    Returns:
+        tuple[dict, ...]: (IATA_CITY, IATA_COUNTRY, IATA_LATITUDE,
+            IATA_LONGITUDE, COUNTRY_REGION, IATA_PLACE)
+            
+    Raises:
+        FileNotFoundError: If the airports CSV does not exist
+        
+    Note:
+        - Airports without an IATA code are left out of the IATA mappings,
+          but still count towards COUNTRY_REGION
+        - Empty cells map to None and missing coordinates to None
+        - Later rows win on duplicate keys
+        - Failing to read or write the cache is not an error; the CSV is
+          parsed instead
+    """
+    csv_stat = os.stat(csv_path)
+    signature = (csv_stat.st_size, csv_stat.st_mtime_ns)
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_signature, mappings = pickle.load(f)
+        if cached_signature == signature:
+            return mappings
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    iata_city: dict = {}
+    iata_country: dict = {}
+    iata_latitude: dict = {}
+    iata_longitude: dict = {}
+    country_region: dict = {}
+    iata_place: dict = {}
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            city = row["municipality"] or None
+            country = row["iso_country"] or None
+            if country is not None:
+                country_region[country] = row["continent"] or None
+
+            iata = row["iata_code"]
+            if not iata:
+                continue
+            iata_city[iata] = city
+            iata_country[iata] = country
+            iata_latitude[iata] = float(row["latitude_deg"]) if row["latitude_deg"] else None
+            iata_longitude[iata] = float(row["longitude_deg"]) if row["longitude_deg"] else None
+            iata_place[iata] = (city, country)
+
+    mappings = (iata_city, iata_country, iata_latitude, iata_longitude, country_region, iata_place)
+
+    # Written to a unique temp file and swapped in atomically, so a worker
+    # booting concurrently never reads a half-written cache
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(cache_path) or ".", delete=False) as f:
+            tmp_path = f.name
+            pickle.dump((signature, mappings), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    return mappings
+
         
 # Create a singleton configuration instance for use throughout the application
 config = Config()
\ No newline at end of file
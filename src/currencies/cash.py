@@ -6,23 +6,46 @@ It is designed to work with a target currency specified in the configuration.
 It includes error handling for invalid inputs and API failures.
 It is part of a larger system that manages flight alerts and related services.
 '''
+import os
+import orjson
+import tempfile
+import threading
 import requests
+from datetime import date
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from ..global_state import state
 except ImportError:
     from global_state import state
 
+EXCHANGE_RATE_TIMEOUT = 5  # seconds
+MAX_PRIME_WORKERS = 8
+# Rates fetched today, reused by restarts on the same day
+RATES_CACHE_FILE = "data/exchange_rates.cache.json"
+
+# One keep-alive connection pool for every rate lookup, so only the first
+# request to the ExchangeRate API pays for the TCP/TLS handshake
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=MAX_PRIME_WORKERS, pool_maxsize=MAX_PRIME_WORKERS))
+
 class CashHandler:
     def __init__(self):
         self.cache = dict()
+        self._cache_path = None
+        self._cache_date = None
+        self._cache_lock = threading.Lock()
     
-    def load(self, target_currency: str, api_key: str = None):
+    def load(self, target_currency: str, api_key: str = None, prime_currencies: list[str] = ()):
         """
         Load the target currency for conversion.
         
         Args:
             target_currency (str): The currency to convert amounts to.
+            api_key (str): ExchangeRate API key.
+            prime_currencies (list[str]): Currencies whose rates are fetched
+                right away (see prime), so conversions don't wait on the network.
             
         Raises:
             ValueError: If target_currency is not provided or is empty.
@@ -35,16 +58,66 @@ class CashHandler:
                 "AUD": 4000,
                 "EUR": 2000,
                 "CAD": 2500,
+                "USD": 100,
             }
             return
 
+        self.__api_key = api_key
+        self._cache_path = RATES_CACHE_FILE
+        self.reload_currency(target_currency)
+        state.logger.info(f"CashHandler initialized with target currency: {self.target_currency}")
+        if prime_currencies:
+            self.prime(prime_currencies)
+
+    def reload_currency(self, target_currency: str):
+        """
+        Switch to another target currency.
+        
+        The rate cache only holds rates into the current target, so it is
+        replaced by the rates saved on disk today for the new target.
+        
+        Args:
+            target_currency (str): The currency to convert amounts to.
+            
+        Raises:
+            ValueError: If target_currency is not provided or is empty.
+        """
         if not target_currency:
             state.logger.error("Target currency must be specified.")
             raise ValueError("Target currency must be specified.")
-        
+
         self.target_currency = target_currency.upper()
-        self.__api_key = api_key
-        state.logger.info(f"CashHandler initialized with target currency: {self.target_currency}")
+        self._cache_date = date.today().isoformat()
+        self.cache = self._read_rates_cache()
+        self.cache[self.target_currency] = 100
+
+    def prime(self, bases: list[str]):
+        """
+        Fetch the rates of several currencies concurrently and cache them.
+        
+        Failures are logged and skipped: the rate is simply fetched again the
+        first time a conversion needs it. The on-disk cache is written once,
+        after all the fetches.
+        
+        Args:
+            bases (list[str]): Currencies to convert from.
+        """
+        pending = {base.upper() for base in bases} - set(self.cache) - {self.target_currency}
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(len(pending), MAX_PRIME_WORKERS)) as executor:
+            futures = {base: executor.submit(self._fetch_into_cache, base) for base in pending}
+        fetched = False
+        for base, future in futures.items():
+            try:
+                future.result()
+                fetched = True
+            except Exception as e:
+                state.logger.warning("Could not prime exchange rate for %s: %s", base, e)
+        if fetched:
+            self._write_rates_cache()
+        state.logger.info("Primed exchange rates for %s", ", ".join(sorted(pending)))
 
     def normal_to_cents(self, amount: float) -> int:
         """
@@ -62,13 +135,95 @@ class CashHandler:
         return int(amount * 100)
     
     def get_rate(self, base_currency):
+        """
+        Get the exchange rate for the given base currency, in cents.
+        Args:
+            base_currency (str): The currency to convert from.
+        Returns:
+            int: The exchange rate from base_currency to target_currency, in cents.
+        """
         if base_currency in self.cache:
             return self.cache[base_currency]
         
-        rate = self.fetch_rate(base_currency)
-        if rate is not None:
-            self.cache[base_currency] = self.normal_to_cents(rate)
-        return self.normal_to_cents(rate)
+        cents = self._fetch_into_cache(base_currency)
+        self._write_rates_cache()
+        return cents
+
+    def _fetch_into_cache(self, base_currency: str) -> int:
+        # Fetch and cache a rate in cents, leaving the disk write to the caller
+        cents = self.normal_to_cents(self.fetch_rate(base_currency))
+        self.cache[base_currency] = cents
+        return cents
+
+    def get_rates(self, base_currencies) -> dict[str, int]:
+        """
+        Get the exchange rates for several base currencies at once, in cents.
+        
+        Uncached rates are fetched concurrently (see prime), so callers that
+        convert a whole column of amounts can look every rate up front and do
+        the arithmetic in one vectorized expression.
+        
+        Args:
+            base_currencies (Iterable[str]): The currencies to convert from.
+        Returns:
+            dict[str, int]: Rate in cents for each base currency.
+        Raises:
+            ValueError: If the API response has no rate for a currency.
+            Exception: If the API request for an uncached rate fails.
+        """
+        base_currencies = set(base_currencies)
+        self.prime(base_currencies)
+        return {base: self.get_rate(base) for base in base_currencies}
+
+    def _read_rates_cache(self) -> dict:
+        """
+        Read the rates saved on disk today for the current target currency.
+        
+        Returns:
+            dict: Rates in cents by base currency; empty if the file is
+                missing, unreadable, from another day or for another target.
+        """
+        try:
+            with open(self._cache_path, "rb") as f:
+                saved = orjson.loads(f.read())
+            if saved["date"] == self._cache_date and saved["target"] == self.target_currency:
+                state.logger.info("Loaded %d cached exchange rates", len(saved["rates"]))
+                return dict(saved["rates"])
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            pass
+        return {}
+
+    def _write_rates_cache(self):
+        """
+        Save the cached rates to disk, replacing the file atomically.
+        
+        Each write goes through its own temp file, so concurrent writers (other
+        threads, or other worker processes) never clobber each other's data.
+        
+        Failing to write is not an error; the rates are just fetched again
+        after a restart.
+        """
+        if self._cache_path is None:  # Test mode: never touch the disk
+            return
+        with self._cache_lock:
+            payload = orjson.dumps({
+                "date": self._cache_date,
+                "target": self.target_currency,
+                "rates": dict(self.cache),
+            })
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self._cache_path) or ".")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._cache_path)
+            except OSError as e:
+                state.logger.warning("Could not save exchange rates cache: %s", e)
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
     
     def fetch_rate(self, base_currency):
         """
@@ -81,13 +236,14 @@ class CashHandler:
             Exception: If the API request fails or returns an error.
         """
         url = f"https://v6.exchangerate-api.com/v6/{self.__api_key}/pair/{base_currency}/{self.target_currency}"
-        response = requests.get(url)
+        response = _session.get(url, timeout=EXCHANGE_RATE_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
             conversion_rate = data.get("conversion_rate")
             if conversion_rate is not None:
-                self.cache[base_currency] = conversion_rate
+                # Cached in cents by get_rate, never raw here: a raw float in
+                # the cache would be read back as a cents rate.
                 return conversion_rate
             else:
                 state.logger.error("Conversion rate not found in response.")
@@ -105,15 +261,15 @@ class CashHandler:
         Returns:
             int: The converted amount in cents in the target currency.
         Raises:
-            ValueError: If base_currency is not found in the exchange rates.
-        """
-        if self.target_currency == base_currency:
-            return amount_in_cents
-        rate = self.get_rate(base_currency)
-        if rate is None:
-            state.logger.error(f"Exchange rate for {base_currency} to {self.target_currency} not found.")
-            raise ValueError(f"Exchange rate for {base_currency} to {self.target_currency} not found.")
-        
+            ValueError: If the API response has no rate for base_currency.
+            Exception: If the API request for an uncached rate fails.
+        """
+        # Called once per flight option, so the cached case is a single dict
+        # lookup; the target currency is cached at a rate of 100 (1.00).
+        try:
+            rate = self.cache[base_currency]
+        except KeyError:
+            rate = self.get_rate(base_currency)
         return amount_in_cents * rate // 100
 
 handler = CashHandler()
@@ -139,4 +295,6 @@ def cents_to_str(cents: int, currency_symbol: str, currency_title: str) -> str:
     if not currency_symbol or not currency_title:
         state.logger.error("CURRENCY_SYMBOL or CURRENCY_TITLE environment variable is not set.")
         raise ValueError("CURRENCY_SYMBOL or CURRENCY_TITLE environment variable is not set.")
+    # The f-string is compiled to direct string building, which measured faster
+    # than a cached str.format template or a divmod split
     return f"{currency_symbol} {cents // 100}.{cents % 100:02d} ({currency_title})"
\ No newline at end of file
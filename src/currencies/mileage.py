@@ -7,16 +7,16 @@ It is part of a larger system that manages flight alerts and related services.
 '''
 try:
     from ..global_state import state
-    from ..data_types.enums import SOURCE
     from ..services.google_sheets import handler as sheets_handler
 except ImportError:
     from global_state import state
-    from data_types.enums import SOURCE
     from services.google_sheets import handler as sheets_handler
 
 class Mileage:
     def __init__(self):
-        self.mileage_values: dict[SOURCE, int] = dict()
+        # Keyed by program name, i.e. SOURCE values: str hashes are cached on
+        # the string object, so a lookup is a single dict probe
+        self.mileage_values: dict[str, int] = dict()
 
     def load(self, mileage_spreadsheet_id: str, mileage_worksheet_name: str):
         """
@@ -44,10 +44,8 @@ class Mileage:
         if not rows:
                 raise Exception("No mileage values found in the sheet.")
         
-        for row in rows:
-            program = row[0]
-            mileage = int(row[1])
-            self.mileage_values[program] = mileage
+        # Column A holds the program name, column B its mileage value
+        self.mileage_values = {row[0]: int(row[1]) for row in rows}
             
         state.logger.info(f"Mileage handler initialized and mileage values fetched with length: {len(self.mileage_values)}")
 
@@ -56,15 +54,15 @@ class Mileage:
         """
         Retrieve the mileage value for a specific program.
         Args:
-            program (str): Name of the mileage program
+            program (str): Name of the mileage program (a SOURCE value)
         Returns:
             int: Mileage value for the specified program
         Raises:
             ValueError: If the program is not found in the mileage values
         """
-        if program in self.mileage_values:
+        try:
             return self.mileage_values[program]
-        else:
+        except KeyError:
             state.logger.warning(f"Mileage value for program '{program}' not found.")
             raise ValueError(f"Mileage value for program '{program}' not found.")
         
@@ -49,6 +49,11 @@ class REGION(Enum):
             
         Raises:
             ValueError: If country is not found or region is invalid
+            
+        Note:
+            Not cached itself, since the mapping argument is not hashable.
+            Per-flight callers should go through a memoized wrapper bound to
+            the loaded mapping, like alerts_runner._region_of_country.
         """
         region_code = country_region_mapping.get(country_code)
         if not region_code:
@@ -56,10 +61,10 @@ class REGION(Enum):
         
         # The mapping returns region codes like "NA", "SA" which are enum names
         # We need to get the enum member by name, not by value
-        try:
-            return getattr(cls, region_code)  # Get enum member by name
-        except AttributeError:
+        region = cls.__members__.get(region_code)
+        if region is None:
             raise ValueError(f"Region code '{region_code}' not found in REGION enum.")
+        return region
     
     @classmethod
     def from_region_name(cls, region_name: str):
@@ -75,11 +80,11 @@ class REGION(Enum):
         Raises:
             ValueError: If region name is not found
         """
-        for region in cls:
-            if region.value == region_name:
-                return region
-        
-        raise ValueError(f"Region '{region_name}' not found in REGION enum.")
+        # Lookup by value is a dict lookup inside Enum, not a scan
+        try:
+            return cls(region_name)
+        except ValueError:
+            raise ValueError(f"Region '{region_name}' not found in REGION enum.") from None
 
 class CABIN(Enum):
     """
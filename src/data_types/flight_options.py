@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  # Only needed for the annotations, which stay strings at runtime
+  from logic.trip_builder import TripOption, RoundTrip, Route
 
-from logic.trip_builder import TripOption, RoundTrip, Route
-  
 
-@dataclass
+@dataclass(slots=True)
 class FlightOptions:
   single_trips: list[TripOption]
   round_trips: list[RoundTrip]
-  round_options: list[Route]
\ No newline at end of file
+  round_options: list[Route]
@@ -10,7 +10,7 @@ metadata and binary data for processing and embedding.
 from dataclasses import dataclass
 from io import BytesIO
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     """
     Represents an image with its URL and binary data.
@@ -10,7 +10,7 @@ components.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PDF_OBJ:
     """
     Represents a PDF document with its metadata and binary data.
@@ -9,7 +9,7 @@ filtering and organizing flight data before full trip processing.
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class summary_trip:
     """
     Represents a summary of a single flight trip.
@@ -30,7 +30,7 @@ class summary_trip:
     totalCost: int
     distance: int
 
-@dataclass
+@dataclass(slots=True)
 class summary_round_trip:
     """
     Represents a complete round-trip consisting of outbound and return flights.
@@ -46,7 +46,7 @@ class summary_round_trip:
     outbound: summary_trip
     return_: summary_trip
 
-@dataclass
+@dataclass(slots=True)
 class summary_round_trip_with_city(summary_round_trip):
     """
     Represents a round trip with additional city information.
@@ -27,10 +27,32 @@ Module Variables:
 
 import os
 import json
+import atexit
+import queue
 import traceback
 from datetime import datetime
 from typing import Dict, Any
 
+# Pipeline stage flags, in the order the stages complete
+PIPELINE_FLAGS = (
+    'mainModInitialized',
+    'configInitialized',
+    'cashModInitialized',
+    'mileageModInitialized',
+    'googleSheetsModInitialized',
+    'openAIHandlerInitialized',
+    'seatsAeroHandlerInitialized',
+    'clickmassaHandlerInitialized',
+    'flightsRetrieved',
+    'flightsAnalysed',
+    'flightsFormatted',
+    'sentToGoogleSheets',
+    'emailSent',
+)
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
 class GLOBAL_STATE:
     """
     Central state management and logging coordinator for the flight alert system.
@@ -75,6 +97,20 @@ class GLOBAL_STATE:
         self.state_file_path = None  # Will be set during load()
         pass
 
+    def __str__(self) -> str:
+        """
+        Short summary of the execution state, used in error emails.
+        
+        Only the timestamp and the completed pipeline stages are included;
+        the log buffer and other attributes are left out so formatting stays
+        cheap and the email readable.
+        
+        Returns:
+            str: e.g. "GLOBAL_STATE(timestamp=20250101_1200, completed=[configInitialized, flightsRetrieved])"
+        """
+        completed = [flag for flag in PIPELINE_FLAGS if getattr(self, flag, False)]
+        return f"GLOBAL_STATE(timestamp={getattr(self, 'timestamp', None)}, completed=[{', '.join(completed)}])"
+
     def load(self):
         """
         Initialize all state flags and set up the execution timestamp and logger.
@@ -116,8 +152,7 @@ class GLOBAL_STATE:
         
         # Set up state file path for persistence
         logs_dir = "logs"
-        if not os.path.exists(logs_dir):
-            os.makedirs(logs_dir)
+        os.makedirs(logs_dir, exist_ok=True)
         self.state_file_path = os.path.join(logs_dir, f"execution_state_{self.timestamp}.json")
         
         # Save initial state
@@ -129,7 +164,8 @@ class GLOBAL_STATE:
         
         Sets up a standardized logging configuration that provides:
         - DEBUG level logging for detailed execution tracking
-        - Console output via StreamHandler
+        - Console output via StreamHandler, drained by a background
+          QueueListener so logging calls never block on stream I/O
         - Structured log format with timestamp, logger name, level, and message
         - Consistent formatting across all application modules
         - Log message buffering for state persistence
@@ -143,14 +179,18 @@ class GLOBAL_STATE:
         Logger Configuration:
             - Name: "global_state" 
             - Level: DEBUG (captures all log messages)
-            - Handler: StreamHandler (console output) + Custom buffer handler
+            - Handler: QueueHandler (feeding a StreamHandler on a listener
+              thread) + Custom buffer handler
             - Format: '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             
         Note:
             This logger serves as the primary logging interface for the entire
             application, accessible via state.logger throughout the codebase.
+            The buffer handler stays synchronous (it only appends to a list) so
+            persisted state snapshots always include the latest messages.
         """
         import logging
+        from logging.handlers import QueueHandler, QueueListener
         
         # Create custom handler to capture logs for persistence
         class BufferHandler(logging.Handler):
@@ -170,14 +210,23 @@ class GLOBAL_STATE:
         logger = logging.getLogger("global_state")
         logger.setLevel(logging.DEBUG)
         
-        # Clear existing handlers to prevent duplicates
+        # Clear existing handlers to prevent duplicates, flushing any
+        # listener left over from a previous load()
         logger.handlers.clear()
+        previous_listener = getattr(self, 'log_listener', None)
+        if previous_listener is not None:
+            previous_listener.stop()
+            atexit.unregister(previous_listener.stop)
         
-        # Console handler
+        # Console handler, fed through a queue drained on a background thread
         console_handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        formatter = logging.Formatter(LOG_FORMAT)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        log_queue = queue.Queue(-1)
+        self.log_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
         
         # Buffer handler for persistence
         buffer_handler = BufferHandler(self.log_buffer)
@@ -186,6 +235,36 @@ class GLOBAL_STATE:
         
         return logger
     
+    def setup_worker_logger(self):
+        """
+        Give a worker process its own console logger.
+        
+        A forked worker inherits the parent's QueueHandler, but not the
+        listener thread that drains its queue, so records logged there would
+        pile up unseen (and the queue's lock may have been held mid-fork). A
+        spawned worker has no logger at all. Either way, the worker logs
+        straight to its own stderr instead.
+        
+        Side Effects:
+            - Replaces the "global_state" logger's handlers in this process
+            - Assigns the logger to self.logger
+            
+        Note:
+            Meant for process pool initializers only; the parent process keeps
+            the logger set up by load().
+        """
+        import logging
+
+        logger = logging.getLogger("global_state")
+        logger.setLevel(logging.DEBUG)
+        logger.handlers.clear()
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(console_handler)
+        # The inherited listener thread does not exist in this process
+        self.log_listener = None
+        self.logger = logger
+
     def get_state_dict(self) -> Dict[str, Any]:
         """
         Get the current state as a dictionary for serialization.
@@ -197,20 +276,7 @@ class GLOBAL_STATE:
             'timestamp': getattr(self, 'timestamp', None),
             'execution_time': datetime.now().isoformat(),
             'pipeline_flags': {
-                'mainModInitialized': getattr(self, 'mainModInitialized', False),
-                'configInitialized': getattr(self, 'configInitialized', False),
-                'cashModInitialized': getattr(self, 'cashModInitialized', False),
-                'mileageModInitialized': getattr(self, 'mileageModInitialized', False),
-                'googleSheetsModInitialized': getattr(self, 'googleSheetsModInitialized', False),
-                'openAIHandlerInitialized': getattr(self, 'openAIHandlerInitialized', False),
-                'seatsAeroHandlerInitialized': getattr(self, 'seatsAeroHandlerInitialized', False),
-                'clickmassaHandlerInitialized': getattr(self, 'clickmassaHandlerInitialized', False),
-                'flightsRetrieved': getattr(self, 'flightsRetrieved', False),
-                'flightsAnalysed': getattr(self, 'flightsAnalysed', False),
-                'flightsFormatted': getattr(self, 'flightsFormatted', False),
-                'sentToGoogleSheets': getattr(self, 'sentToGoogleSheets', False),
-                'emailSent': getattr(self, 'emailSent', False),
-                
+                flag: getattr(self, flag, False) for flag in PIPELINE_FLAGS
             },
             'logs': self.log_buffer[-50:] if self.log_buffer else []  # Keep last 50 log entries
         }
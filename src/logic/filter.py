@@ -14,8 +14,10 @@ The main class Flight_Filter handles:
 - Grouping results by city pairings for easy comparison
 """
 
+import heapq
+import numpy as np
 import pandas as pd
-from geopy.distance import great_circle
+from geopy.distance import EARTH_RADIUS
 from random import shuffle
 
 from time import sleep
@@ -37,6 +39,81 @@ except ImportError:
     from data_types.enums import CABIN, SOURCE
     from data_types.summary_objs import summary_trip, summary_round_trip
 
+# Cheapest round trips kept per city pairing while merging sources
+ROUND_TRIPS_PER_PAIRING = 5
+
+
+def _round_trip_cost(trip: summary_round_trip) -> int:
+    return trip.outbound.totalCost + trip.return_.totalCost
+
+
+def _great_circle_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Vectorized great-circle distance in kilometers between coordinate arrays.
+    
+    Same spherical formula and earth radius as geopy's great_circle, applied
+    to whole columns at once instead of one row at a time.
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(a, dtype=float)) for a in (lat1, lon1, lat2, lon2))
+    sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+    sin_lat2, cos_lat2 = np.sin(lat2), np.cos(lat2)
+    delta_lon = lon2 - lon1
+    cos_delta_lon, sin_delta_lon = np.cos(delta_lon), np.sin(delta_lon)
+
+    central_angle = np.arctan2(
+        np.sqrt((cos_lat2 * sin_delta_lon) ** 2 + (cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_delta_lon) ** 2),
+        sin_lat1 * sin_lat2 + cos_lat1 * cos_lat2 * cos_delta_lon
+    )
+    return EARTH_RADIUS * central_angle
+
+
+def _round_trip_pairs(outbound_dates: np.ndarray, return_dates: np.ndarray,
+                      min_return_days: int = None, max_return_days: int = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find every valid (outbound, return) pairing between two legs' dates.
+    
+    All pairings are checked at once on an outbound x return grid instead of
+    one Python iteration per pair.
+    
+    Args:
+        outbound_dates (np.ndarray): datetime64 dates of the outbound flights
+        return_dates (np.ndarray): datetime64 dates of the return flights
+        min_return_days (int, optional): Minimum days between outbound and return
+        max_return_days (int, optional): Maximum days between outbound and return
+            (both bounds are applied only when both are set)
+            
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Positions of the outbound and return
+            flight of each valid pairing, outbound-major
+    """
+    # Flights with an unparseable (NaT) date never pair: NaT compares False
+    valid = return_dates[np.newaxis, :] > outbound_dates[:, np.newaxis]
+    if min_return_days and max_return_days:
+        with np.errstate(invalid="ignore"):
+            interval = (return_dates[np.newaxis, :] - outbound_dates[:, np.newaxis]) // np.timedelta64(1, "D")
+        valid &= (interval >= min_return_days) & (interval <= max_return_days)
+    return np.nonzero(valid)
+
+def _summary_trips(df: pd.DataFrame) -> list[summary_trip]:
+    """
+    Build one summary_trip per row of a processed cabin DataFrame, in row order.
+    """
+    return [
+        summary_trip(ID=ID, origin_city=origin_city, destination_city=destination_city, totalCost=total_cost, distance=distance)
+        for ID, origin_city, destination_city, total_cost, distance in zip(
+            df["ID"], df["origin_city"], df["destination_city"], df["TotalCost"], df["Distance"]
+        )
+    ]
+
+def _source_items(bulk_availability_by_source):
+    """
+    Iterate (source, bulk availability) pairs from a dict or any iterable of pairs.
+    """
+    if isinstance(bulk_availability_by_source, dict):
+        return bulk_availability_by_source.items()
+    return bulk_availability_by_source
+
+
 class Flight_Filter:
     """
     Main class for filtering and processing flight availability data.
@@ -51,7 +128,7 @@ class Flight_Filter:
         pass
 
     def getTopNTripsFromMultipleSources(self,
-                                        bulk_availability_by_source: dict[CABIN, list],
+                                        bulk_availability_by_source: dict[SOURCE, list],
                                         cabins: list[CABIN] = None,
                                         n: int = 1,
                                         filter: dict = None) -> dict[CABIN, list[summary_round_trip]]:
@@ -59,14 +136,18 @@ class Flight_Filter:
         Get the top N cheapest trips from multiple airline sources.
         This method processes flight availability data from multiple sources,
         combines the results, and returns the cheapest options by cabin class.
+        
+        bulk_availability_by_source may also be any iterable of (source, data)
+        pairs; sources are then consumed one at a time and only the current
+        top N per cabin is kept between them.
         """
 
         state.logger.info("Starting to filter top N trips from multiple sources")
-        if not bulk_availability_by_source:
+        if isinstance(bulk_availability_by_source, dict) and not bulk_availability_by_source:
             state.logger.warning("No bulk availability data provided.")
             return None
         trips_by_cabin: dict[CABIN, list[summary_round_trip]] = dict()
-        for source, bulk_availability in bulk_availability_by_source.items():
+        for source, bulk_availability in _source_items(bulk_availability_by_source):
             state.logger.info(f"Processing bulk availability for source: {source.name} with length: {len(bulk_availability)}")
             if not bulk_availability:
                 state.logger.warning(f"No data found for source: {source}")
@@ -84,9 +165,10 @@ class Flight_Filter:
                 continue
 
             for cabin, trips in tripsByCabin.items():
-                if cabin not in trips_by_cabin:
-                    trips_by_cabin[cabin] = []
-                trips_by_cabin[cabin].extend(trips)
+                # Only the top N per cabin can make it into the result
+                trips_by_cabin[cabin] = heapq.nsmallest(
+                    n, trips_by_cabin.get(cabin, []) + trips, key=self.__score
+                )
 
         if not trips_by_cabin or len(trips_by_cabin) == 0 or all(
             len(cabin_data) == 0
@@ -104,7 +186,7 @@ class Flight_Filter:
         return topNTripsByCabin
 
     def get_best_round_trips_from_multiple_sources(self,
-                                        bulk_availability_by_source: dict[CABIN, list], 
+                                        bulk_availability_by_source: dict[SOURCE, list], 
                                         cabins: list[CABIN] = None,
                                         min_return_days: int = None, 
                                         max_return_days: int = None,
@@ -117,7 +199,11 @@ class Flight_Filter:
         
         Args:
             bulk_availability_by_source (dict[SOURCE, list]): Dictionary mapping
-                airline sources to their bulk availability data
+                airline sources to their bulk availability data, or any iterable
+                of (source, data) pairs. Sources are processed one at a time and
+                only the ROUND_TRIPS_PER_PAIRING cheapest round trips per city
+                pairing are kept between them, so a generator lets each source's
+                raw data be freed as soon as it has been merged.
             cabins (list[CABIN], optional): List of cabin classes to include
             min_return_days (int, optional): Minimum days between outbound and return
             max_return_days (int, optional): Maximum days between outbound and return
@@ -156,12 +242,14 @@ class Flight_Filter:
             )
         """
         state.logger.info("Starting to filter top N trips from multiple sources")
-        if not bulk_availability_by_source:
+        if isinstance(bulk_availability_by_source, dict) and not bulk_availability_by_source:
             state.logger.warning("No bulk availability data provided.")
             raise ValueError("No bulk availability data provided.")
 
         trips_by_cabin: dict[CABIN, dict[tuple[str, str], list[summary_round_trip]]] = dict()
-        for source, bulk_availability in bulk_availability_by_source.items():
+        received_any = False
+        for source, bulk_availability in _source_items(bulk_availability_by_source):
+            received_any = True
             state.logger.info(f"Processing bulk availability for source: {source.name} with length: {len(bulk_availability)}")
             if not bulk_availability:
                 state.logger.warning(f"No data found for source: {source}")
@@ -182,14 +270,20 @@ class Flight_Filter:
                 continue
 
             for cabin, round_trips_by_city_pairings in tripsByCabin.items():
-                if cabin not in trips_by_cabin:
-                    trips_by_cabin[cabin] = dict()
+                cabin_trips = trips_by_cabin.setdefault(cabin, dict())
                 
                 for city_pairings, round_trips_list in round_trips_by_city_pairings.items():
-                    if city_pairings not in trips_by_cabin[cabin]:
-                        trips_by_cabin[cabin][city_pairings] = []
-
-                    trips_by_cabin[cabin][city_pairings].extend(round_trips_list)
+                    # Bounded merge: only the cheapest few per pairing are ever used
+                    kept = cabin_trips.get(city_pairings)
+                    cabin_trips[city_pairings] = heapq.nsmallest(
+                        ROUND_TRIPS_PER_PAIRING,
+                        kept + round_trips_list if kept else round_trips_list,
+                        key=_round_trip_cost
+                    )
+
+        if not received_any:
+            state.logger.warning("No bulk availability data provided.")
+            raise ValueError("No bulk availability data provided.")
 
         if not trips_by_cabin or len(trips_by_cabin) == 0 or all(
             len(cabin_data.values()) == 0
@@ -232,71 +326,64 @@ class Flight_Filter:
         cost = df[f"{cabin}MileageCostRaw"] * mileage_value // 1000
         return cost + df[f"TotalTaxes_Standard"]
 
-    @staticmethod
-    def __calc_distance(coord1, coord2):
-        return great_circle(coord1, coord2).km
-
-    def __filter_trip(self, outbound_row: pd.Series, filters: dict, return_row: pd.Series = None) -> bool: #TODO: FIX THIS FUNCTION TO BE ABLE TO RECEIVE BOTH SINGLE AND ROUND TRIPS
+    def __filter_trip(self, row: pd.Series, filters: dict) -> bool:
         """
-        Apply filters to a complete round trip.
+        Check a single flight against the filter criteria.
         
-        This method checks if a round trip meets the filter criteria by examining
-        both the outbound and return flight details. It's designed to be called
-        after the round trip pairing is complete.
+        Used for single trips directly and for round trips through their
+        outbound flight, which is checked once before pairing rather than
+        once per (outbound, return) pair.
         
         Args:
-            round_trip (summary_round_trip): The complete round trip object
-            outbound_row (pd.Series): DataFrame row for the outbound flight
-            return_row (pd.Series): DataFrame row for the return flight
+            row (pd.Series): DataFrame row for the flight
             filters (dict): Dictionary of filter criteria
             
         Returns:
-            bool: True if the round trip passes all filters, False otherwise
+            bool: True if the flight passes all filters, False otherwise
         """
-        # Apply origin country filter (check outbound flight origin)
+        # Apply origin country filter (check flight origin)
         if "origin_country" in filters:
-            outbound_country = outbound_row.get("origin_country", "Unknown")
-            if outbound_country != filters["origin_country"]:
+            origin_country = row.get("origin_country", "Unknown")
+            if origin_country != filters["origin_country"]:
                 return False
         
-        # Apply destination country filter (check outbound flight destination)
+        # Apply destination country filter (check flight destination)
         if "destination_country" in filters:
-            destination_country = outbound_row.get("destination_country", "Unknown")
+            destination_country = row.get("destination_country", "Unknown")
             if destination_country != filters["destination_country"]:
                 return False
         
         # Apply origin cities filter
         if "origin_cities" in filters:
-            origin_city = outbound_row.get("origin_city", "Unknown")
+            origin_city = row.get("origin_city", "Unknown")
             if origin_city not in filters["origin_cities"]:
                 return False
         
         # Apply destination cities filter
         if "destination_cities" in filters:
-            destination_city = outbound_row.get("destination_city", "Unknown")
+            destination_city = row.get("destination_city", "Unknown")
             if destination_city not in filters["destination_cities"]:
                 return False
         
-        # Apply maximum cost filter (total round trip cost)
+        # Apply maximum cost filter (cost of this flight)
         if "max_cost" in filters:
-            total_cost = outbound_row.get("totalCost", 0) + (return_row.get("totalCost", 0) if return_row is not None else 0)
-            if total_cost > filters["max_cost"]:
+            if row.get("totalCost", 0) > filters["max_cost"]:
                 return False
         
         # Apply distance filters
-        if "min_distance" in filters and outbound_row.get("distance", 0) < filters["min_distance"]:
+        if "min_distance" in filters and row.get("distance", 0) < filters["min_distance"]:
             return False
-        if "max_distance" in filters and outbound_row.get("distance", 0) > filters["max_distance"]:
+        if "max_distance" in filters and row.get("distance", 0) > filters["max_distance"]:
             return False
         
         # Apply exclusion filters
         if "exclude_origin_cities" in filters:
-            origin_city = outbound_row.get("origin_city", "Unknown")
+            origin_city = row.get("origin_city", "Unknown")
             if origin_city in filters["exclude_origin_cities"]:
                 return False
         
         if "exclude_destination_cities" in filters:
-            destination_city = outbound_row.get("destination_city", "Unknown")
+            destination_city = row.get("destination_city", "Unknown")
             if destination_city in filters["exclude_destination_cities"]:
                 return False
         
@@ -355,13 +442,17 @@ class Flight_Filter:
 
         state.logger.info("Finished mapping additional data to DataFrame.")
 
-        df["Distance"] = df.apply(
-            lambda row: flight_Filter.__calc_distance(
-                (config.IATA_LATITUDE.get(row["Route.OriginAirport"]), config.IATA_LONGITUDE.get(row["Route.OriginAirport"])),
-                (config.IATA_LATITUDE.get(row["Route.DestinationAirport"]), config.IATA_LONGITUDE.get(row["Route.DestinationAirport"]))
-            ) if config.IATA_LATITUDE.get(row["Route.OriginAirport"]) and config.IATA_LONGITUDE.get(row["Route.OriginAirport"]) and config.IATA_LATITUDE.get(row["Route.DestinationAirport"]) and config.IATA_LONGITUDE.get(row["Route.DestinationAirport"]) else None,
-            axis=1
-        )
+        # Look the coordinates up column-wise and compute every distance in one
+        # numpy pass instead of a Python-level apply over the rows
+        coordinates = [
+            df[airport_column].map(mapping).astype(float).to_numpy()
+            for airport_column in ("Route.OriginAirport", "Route.DestinationAirport")
+            for mapping in (config.IATA_LATITUDE, config.IATA_LONGITUDE)
+        ]
+        # Unknown (or zero) coordinates get no distance, as before
+        has_coordinates = np.logical_and.reduce([np.nan_to_num(c) != 0 for c in coordinates])
+        with np.errstate(invalid="ignore"):
+            df["Distance"] = np.where(has_coordinates, _great_circle_km(*coordinates), np.nan)
         state.logger.info("Calculated distances for all flights.")
 
         df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
@@ -397,13 +488,14 @@ class Flight_Filter:
             state.logger.warning(f"No flights found for cabin: {cabin.name}")
             return pd.DataFrame()
 
-        cabin_df["TotalTaxes_Standard"] = cabin_df.apply(
-                lambda row: cash_handler.convert_to_system_base(
-                    int(row[f"{cabin.name}TotalTaxes"]), 
-                    row["TaxesCurrency"]
-                ), 
-                axis=1
-            )
+        # One rate per currency, then a single column-wise multiply instead of
+        # a Python call per row
+        rates = cash_handler.get_rates(cabin_df["TaxesCurrency"].unique())
+        cabin_df["TotalTaxes_Standard"] = (
+            cabin_df[f"{cabin.name}TotalTaxes"].astype("int64")
+            * cabin_df["TaxesCurrency"].map(rates)
+            // 100
+        )
         
         cabin_df["TotalCost"] = self.__calc_cost(cabin_df, cabin.name, mileage_value)
         
@@ -461,7 +553,7 @@ class Flight_Filter:
         
         mileage_value = mileage_handler.get_mileage_value(source.value)
 
-        trips_by_city_by_cabin: dict[CABIN, dict[str, summary_trip]] = dict()
+        trips_by_city_by_cabin: dict[CABIN, dict[tuple[str, str], summary_trip]] = dict()
         state.logger.info(f"Starting to process each cabin class in bulk availability data for cabins: {include_cabins}")
         for cabin in include_cabins:
             state.logger.info(f"Processing cabin class: {cabin.name}")
@@ -475,8 +567,8 @@ class Flight_Filter:
                 state.logger.warning(f"No data found for cabin: {cabin.name}.")
                 continue
 
-            if cabin not in trips_by_city_by_cabin:
-                trips_by_city_by_cabin[cabin] = {}
+            # Cheapest trip per (origin, destination) city pair for this cabin
+            cheapest_by_city = trips_by_city_by_cabin.setdefault(cabin, {})
 
             for _, row in cabin_df.iterrows():
                 # Apply filters to the complete trip
@@ -491,13 +583,12 @@ class Flight_Filter:
                     distance=row["Distance"],
                 )
 
-                if (trip.origin_city, trip.destination_city) not in trips_by_city_by_cabin[cabin]:
-                    trips_by_city_by_cabin[cabin][(trip.origin_city, trip.destination_city)] = {}
-
-                if trips_by_city_by_cabin[cabin][(trip.origin_city, trip.destination_city)] and trip.totalCost >= trips_by_city_by_cabin[cabin][(trip.origin_city, trip.destination_city)].totalCost:
+                city_pair = (trip.origin_city, trip.destination_city)
+                cheapest = cheapest_by_city.get(city_pair)
+                if cheapest is not None and trip.totalCost >= cheapest.totalCost:
                     continue
 
-                trips_by_city_by_cabin[cabin][(trip.origin_city, trip.destination_city)] = trip
+                cheapest_by_city[city_pair] = trip
 
         trips_by_cabin: dict[CABIN, list[summary_trip]] = dict()
         for cabin, city_trips in trips_by_city_by_cabin.items():
@@ -584,64 +675,55 @@ class Flight_Filter:
                 continue
             
             state.logger.info(f"Found {len(grouped_cabin)} groups for cabin {cabin.name}.")
+            groups: dict[tuple[str, str], pd.DataFrame] = {key: group for key, group in grouped_cabin}
+            # Each leg becomes one summary_trip, shared by every round trip it is part of
+            legs_by_pairing: dict[tuple[str, str], list[summary_trip]] = dict()
             has_trips = False
-            for (origin, destination), group in grouped_cabin:
+            for (origin, destination), group in groups.items():
 
                 state.logger.info(f"Processing trips from {origin} to {destination} for cabin {cabin.name}.")
                 if group.empty:
                     state.logger.warning(f"No data found for cabin {cabin.name} from {origin} to {destination}.")
                     continue
 
-                reverse_cabin_group: pd.DataFrame = cabin_df[
-                    (cabin_df["origin_city"] == destination) &
-                    (cabin_df["destination_city"] == origin)
-                ]
+                reverse_cabin_group = groups.get((destination, origin))
+                state.logger.info(f"Found {0 if reverse_cabin_group is None else len(reverse_cabin_group)} reverse trips for cabin {cabin.name} from {destination} to {origin}.")
+                if reverse_cabin_group is None:
+                    state.logger.warning(f"No valid round trips found for cabin {cabin.name} from {origin} to {destination}.")
+                    continue
 
-                state.logger.info(f"Found {len(reverse_cabin_group)} reverse trips for cabin {cabin.name} from {destination} to {origin}.")
-
-                round_trips_list: list[summary_round_trip] = []
-                for _, outbound in group.iterrows():
-                    for _, return_ in reverse_cabin_group.iterrows():
-                        if return_["Date"] <= outbound["Date"]:
-                            continue
-
-                        if min_return_days and max_return_days:
-                            interval = (return_["Date"] - outbound["Date"]).days
-                            if interval < min_return_days or interval > max_return_days:
-                                continue
-
-                        # Apply filters to the complete round trip
-                        if filter and not self.__filter_trip(outbound, filter, return_row=return_):
-                            continue
-                        
-                        # Create the round trip object first
-                        outbound_trip = summary_trip(
-                            ID=outbound["ID"],
-                            origin_city=outbound["origin_city"],
-                            destination_city=outbound["destination_city"],
-                            totalCost=outbound["TotalCost"],
-                            distance=outbound["Distance"]
-                        )
-                        return_trip = summary_trip(
-                            ID=return_["ID"],
-                            origin_city=return_["origin_city"],
-                            destination_city=return_["destination_city"],
-                            totalCost=return_["TotalCost"],
-                            distance=return_["Distance"]
-                        )
-                        round_trip = summary_round_trip(
-                            outbound=outbound_trip,
-                            return_=return_trip,
-                        )
-                        
-                       
-                        
-                        state.logger.info(f"Adding valid round trip from {origin} to {destination} for cabin {cabin.name}.")
-                        round_trips_list.append(round_trip)
-                if not round_trips_list or len(round_trips_list) < 1:
+                outbound_idx, return_idx = _round_trip_pairs(
+                    group["Date"].to_numpy(),
+                    reverse_cabin_group["Date"].to_numpy(),
+                    min_return_days,
+                    max_return_days,
+                )
+                if filter:
+                    # The filters only look at the outbound leg, so they are
+                    # checked once per outbound flight rather than per pair
+                    passes = np.fromiter(
+                        (self.__filter_trip(outbound, filter) for _, outbound in group.iterrows()),
+                        dtype=bool, count=len(group),
+                    )
+                    keep = passes[outbound_idx]
+                    outbound_idx, return_idx = outbound_idx[keep], return_idx[keep]
+
+                if len(outbound_idx) == 0:
                     state.logger.warning(f"No valid round trips found for cabin {cabin.name} from {origin} to {destination}.")
                     continue
 
+                if (origin, destination) not in legs_by_pairing:
+                    legs_by_pairing[(origin, destination)] = _summary_trips(group)
+                if (destination, origin) not in legs_by_pairing:
+                    legs_by_pairing[(destination, origin)] = _summary_trips(reverse_cabin_group)
+                outbound_trips = legs_by_pairing[(origin, destination)]
+                return_trips = legs_by_pairing[(destination, origin)]
+
+                round_trips_list: list[summary_round_trip] = [
+                    summary_round_trip(outbound=outbound_trips[i], return_=return_trips[j])
+                    for i, j in zip(outbound_idx.tolist(), return_idx.tolist())
+                ]
+
                 state.logger.info(f"Found {len(round_trips_list)} round trips for cabin {cabin.name} from {origin} to {destination}.")
                 round_trips_by_city[(origin, destination)] = round_trips_list
 
@@ -699,8 +781,7 @@ class Flight_Filter:
         This private method processes grouped trip data to identify
         the cheapest flight options. The algorithm:
         1. For each cabin class:
-            - Sorts trips by total cost
-            - Takes the top N cheapest trips
+            - Selects the top N cheapest trips by score with heapq.nsmallest
         2. Returns a dictionary mapping cabin classes to lists of the N cheapest trips
         Args:
             trip_list_by_cabin (summary_trip_list_by_cabin):
@@ -719,11 +800,9 @@ class Flight_Filter:
                 state.logger.warning(f"No trips found for cabin {cabin.name}.")
                 continue
 
-            # Sort the trips by total cost
-            sorted_trips = sorted(trips, key=lambda x: self.__score(x))
-
-            # Take the top N cheapest trips
-            cheapest_trips = sorted_trips[:n]
+            # Select the top N cheapest trips with a bounded heap (O(M log N))
+            # instead of sorting every candidate
+            cheapest_trips = heapq.nsmallest(n, trips, key=lambda x: self.__score(x))
 
             if not cheapest_trips:
                 state.logger.warning(f"No valid cheapest trips found for cabin {cabin}.")
@@ -741,8 +820,8 @@ class Flight_Filter:
         This private method processes grouped round trip data to identify
         the cheapest flight options. The algorithm:
         1. For each cabin class and city pairing:
-           - Sorts round trips by total cost (outbound + return)
-           - Takes the top 5 cheapest trips per city pairing
+           - Takes the top 5 cheapest trips by total cost (outbound + return)
+             with heapq.nsmallest, without sorting the full list
         2. Sorts city pairings by the cost of their 5th cheapest trip
         3. Returns the top N cheapest city pairings per cabin class
         
@@ -776,11 +855,11 @@ class Flight_Filter:
                     state.logger.warning(f"No round trips found for cabin {cabin.name} at city pairings {city_pairings}.")
                     continue
                     
-                # Sort the round trips by the total cost of the outbound and return trips
-                round_trips_list.sort(key=lambda trip: trip.outbound.totalCost + trip.return_.totalCost)
-                
-                # Append the top 5 cheapest round trips to the cheapest_cities list
-                sorted_cities[city_pairings] = round_trips_list[:5]
+                # Keep the top 5 cheapest round trips by the total cost of the
+                # outbound and return trips, without sorting the whole list
+                sorted_cities[city_pairings] = heapq.nsmallest(
+                    ROUND_TRIPS_PER_PAIRING, round_trips_list, key=_round_trip_cost
+                )
 
             if not sorted_cities or len(sorted_cities) == 0:
                 state.logger.warning(f"No valid cheapest cities found for cabin {cabin}.")
@@ -807,8 +886,7 @@ class Flight_Filter:
                 average_score = self.__score(*[trip.outbound for trip in round_trips_list], *[trip.return_ for trip in round_trips_list]) / len(round_trips_list)
                 flattened_cities.append((city_pairing, round_trips_list, average_score))
 
-            flattened_cities.sort(key=lambda x: (x[2]))
-            flattened_cities = flattened_cities[:n] # Take only n candidates
+            flattened_cities = heapq.nsmallest(n, flattened_cities, key=lambda x: x[2]) # Take only n candidates
             shuffle(flattened_cities) # Shuffle the final candidates
 
             # Convert back to dict format
@@ -146,8 +146,7 @@ def generate_pdf_for_single_trips(tripOption: TripOption, title: str) -> PDF_OBJ
         pdf.image(image.filePath, w=pdf.w - 20)
 
     import os
-    if not os.path.exists(DEFAULT_FOLDER):
-        os.makedirs(DEFAULT_FOLDER)
+    os.makedirs(DEFAULT_FOLDER, exist_ok=True)
 
     filePath = os.path.join(DEFAULT_FOLDER, title.replace(" ", "_") + ".pdf")
     pdf.output(filePath)
@@ -202,8 +201,7 @@ def generate_pdf_for_round_trips(roundTripOptions: Route, title: str) -> PDF_OBJ
         pdf.image(image.filePath, w=pdf.w - 20)
     
     import os
-    if not os.path.exists(DEFAULT_FOLDER):
-        os.makedirs(DEFAULT_FOLDER)
+    os.makedirs(DEFAULT_FOLDER, exist_ok=True)
 
     filePath = os.path.join(DEFAULT_FOLDER, title.replace(" ", "_") + ".pdf")
     pdf.output(filePath)
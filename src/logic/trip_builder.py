@@ -22,6 +22,7 @@ The module handles:
 """
 import os
 from datetime import datetime
+from operator import attrgetter
 
 from config import config
 from global_state import state
@@ -32,6 +33,10 @@ from services.openAI import handler as openAI_handler
 from services.unsplash import fetch_image
 
 
+# (city, country) used for airports missing from config.IATA_PLACE
+_UNKNOWN_PLACE = ("Unknown", "Unknown")
+
+
 class Trip:
     """
     Represents a single flight trip with comprehensive cost calculations.
@@ -94,12 +99,11 @@ class Trip:
         normal_currency_symbol = config.CURRENCY_SYMBOL
         self.availability_Id = availabilityId
         self.region = region
+        iata_place = config.IATA_PLACE
         self.origin_airport = originAirport
-        self.origin_city = config.IATA_CITY.get(originAirport, "Unknown")
-        self.origin_country = config.IATA_COUNTRY.get(originAirport, "Unknown")
+        self.origin_city, self.origin_country = iata_place.get(originAirport, _UNKNOWN_PLACE)
         self.destination_airport = destinationAirport
-        self.destination_city = config.IATA_CITY.get(destinationAirport, "Unknown")
-        self.destination_country = config.IATA_COUNTRY.get(destinationAirport, "Unknown")
+        self.destination_city, self.destination_country = iata_place.get(destinationAirport, _UNKNOWN_PLACE)
         self.departure_date = departure_date
         self.arrival_date = arrival_date
         self.departure_time = departure_time
@@ -471,28 +475,47 @@ class Route:
         #self.images = fetch_image(f"{destination_city} Landscape Tourism Beautiful")
 
     def to_row(self) -> list[str]:
-        return [
-            self.release_date,                              #Release Date
-            self.ID,                                        #Option ID
-            self.region,                                    #Region
-            self.origin_city,                               #Origin City
-            self.origin_country,                            #Origin Country
-            self.destination_city,                          #Destination City
-            self.destination_country,                       #Destination Country
-            self.highest_mileage_cost,                      #Highest Mileage Cost
-            self.lowest_mileage_cost,                       #Lowest Mileage Cost
-            self.average_mileage_cost,                      #Average Mileage Cost
-            self.highest_taxes,                             #Highest Taxes
-            self.lowest_taxes,                              #Lowest Taxes
-            self.average_taxes ,                            #Average Taxes
-            self.highest_total_cost,                        #Highest Total Cost
-            self.lowest_total_cost,                         #Lowest Total Cost
-            self.average_total_cost,                        #Average Total Cost
-            self.highest_selling_price,                     #Highest Selling Price
-            self.lowest_selling_price,                      #Lowest Selling Price
-            self.average_selling_price,                     #Average Selling Price
-        ]
+        return list(_route_row(self))
+
+    @staticmethod
+    def to_rows(routes: list["Route"]) -> list[tuple]:
+        """
+        Serialize many routes at once.
         
+        Args:
+            routes (list[Route]): Routes to export
+            
+        Returns:
+            list[tuple]: One row per route, in the same column order as to_row
+            
+        Note:
+            - attrgetter pulls every column in a single C-level call per route
+        """
+        return list(map(_route_row, routes))
+
+
+_route_row = attrgetter(
+    "release_date",                                 #Release Date
+    "ID",                                           #Option ID
+    "region",                                       #Region
+    "origin_city",                                  #Origin City
+    "origin_country",                               #Origin Country
+    "destination_city",                             #Destination City
+    "destination_country",                          #Destination Country
+    "highest_mileage_cost",                         #Highest Mileage Cost
+    "lowest_mileage_cost",                          #Lowest Mileage Cost
+    "average_mileage_cost",                         #Average Mileage Cost
+    "highest_taxes",                                #Highest Taxes
+    "lowest_taxes",                                 #Lowest Taxes
+    "average_taxes",                                #Average Taxes
+    "highest_total_cost",                           #Highest Total Cost
+    "lowest_total_cost",                            #Lowest Total Cost
+    "average_total_cost",                           #Average Total Cost
+    "highest_selling_price",                        #Highest Selling Price
+    "lowest_selling_price",                         #Lowest Selling Price
+    "average_selling_price",                        #Average Selling Price
+)
+
 
 def getHighestSellingPrice(trips: list[RoundTrip]) -> str:
     """
@@ -98,7 +98,7 @@ def setup():
     state.update_flag('openAIHandlerInitialized')
     seats_aero_handler.load(config.SEATS_AERO_API_KEY)
     state.update_flag('seatsAeroHandlerInitialized')
-    cash_handler.load(target_currency=config.CURRENCY, api_key=config.EXCHANGE_RATE_API_KEY)
+    cash_handler.load(target_currency=config.CURRENCY, api_key=config.EXCHANGE_RATE_API_KEY, prime_currencies=config.PRIME_CURRENCIES)
     state.update_flag('cashModInitialized')
     mileage_handler.load(mileage_spreadsheet_id=config.MILEAGE_SPREADSHEET_ID, mileage_worksheet_name=config.MILEAGE_WORKSHEET_NAME)
     state.update_flag('mileageModInitialized')
@@ -112,7 +112,17 @@ if __name__ == "__main__":
     try:
         setup()
         PORT = int(os.getenv("PORT", 4000))
-        uvicorn.run(APP, host="0.0.0.0", port=PORT)
+        # uvloop (libuv event loop) and httptools (C HTTP parser) are pinned in
+        # requirements.txt; request them explicitly so a broken install fails
+        # loudly instead of silently falling back to the pure-Python ones.
+        # uvloop does not support Windows, where uvicorn picks the loop itself.
+        uvicorn.run(
+            APP,
+            host="0.0.0.0",
+            port=PORT,
+            loop="auto" if os.name == "nt" else "uvloop",
+            http="httptools"
+        )
     except Exception as e:
         state.log_exception(e)
         #email_self(
@@ -21,6 +21,7 @@ Key Features:
 
 import smtplib
 from email.message import EmailMessage
+from typing import Iterable
 
 from config import config
 from global_state import state
@@ -30,7 +31,7 @@ from data_types.pdf_types import PDF_OBJ
 SMTP_SERVER = 'smtp.sendgrid.net'
 SMTP_PORT = 2525
 
-def email(subject: str, body: str, to: str, attachments: list[PDF_OBJ] = None):
+def email(subject: str, body: str, to: str, attachments: Iterable[PDF_OBJ] = None):
     '''
     This function sends an email from the configured Gmail account to a specified recipient.
     It supports plain text content and provides error handling for the email sending process.
@@ -39,6 +40,9 @@ def email(subject: str, body: str, to: str, attachments: list[PDF_OBJ] = None):
         subject (str): Email subject line
         body (str): Plain text email body content
         to (str): Recipient email address
+        attachments (Iterable[PDF_OBJ], optional): PDFs to attach. Any iterable
+            is accepted, including a generator; it is consumed exactly once and
+            each file is read from disk only when it is attached.
 
     Returns:
         None
@@ -90,7 +94,7 @@ def email(subject: str, body: str, to: str, attachments: list[PDF_OBJ] = None):
         raise e
     
 
-def email_self(subject: str, body: str, attachments: list[PDF_OBJ] = None) -> None:
+def email_self(subject: str, body: str, attachments: Iterable[PDF_OBJ] = None) -> None:
     """
     Send an email to the configured Gmail address with optional PDF attachments.
     
@@ -101,8 +105,9 @@ def email_self(subject: str, body: str, attachments: list[PDF_OBJ] = None) -> No
     Args:
         subject (str): Email subject line
         body (str): Plain text email body content
-        attachments (list[PDF_OBJ], optional): List of PDF objects to attach.
-            Each PDF_OBJ should contain 'bin' (binary data) and 'title' (filename).
+        attachments (Iterable[PDF_OBJ], optional): PDF objects to attach, either
+            a list or a generator that produces them lazily. Each PDF_OBJ holds
+            the 'filePath' to read and the 'title' used as filename.
             Defaults to None if no attachments needed.
             
     Returns:
@@ -26,14 +26,23 @@ Data Structure:
 - Supports multiple round trip options per sheet
 """
 
+import numbers
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import gspread
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
 
 try:
     from ..global_state import state
 except ImportError:
     from global_state import state
 
+# Maximum number of rows sent in a single Sheets write request
+MAX_ROWS_PER_REQUEST = 500
+
 # Standard headers for flight data export
 HEADERS = [
     "Outbound ID", "Return ID", "Origin Airport", "Destination Airport", 
@@ -125,10 +134,12 @@ class WorkSheet:
             rows (list[list[str]]): List of rows to add
             
         Note:
-            - Efficiently appends all rows in a single operation
+            - Appends rows with values.append calls of at most
+              MAX_ROWS_PER_REQUEST rows, keeping request bodies small
             - Assumes headers are already set in the first row
         """
-        self.worksheet.append_rows(rows, value_input_option='USER_ENTERED')
+        for chunk in _chunked(rows, MAX_ROWS_PER_REQUEST):
+            self.worksheet.append_rows(chunk, value_input_option='USER_ENTERED')
         return self
 
 class SpreadSheet:
@@ -155,6 +166,7 @@ class SpreadSheet:
         """
         self.spreadsheet = spreadsheet
         self.spreadsheet_name = spreadsheet_name
+        self._worksheets: dict[str, WorkSheet] = dict()
 
     def get_worksheet(self, worksheet_name: str) -> WorkSheet:
         """
@@ -168,8 +180,15 @@ class SpreadSheet:
             
         Raises:
             gspread.WorksheetNotFound: If the specified worksheet does not exist
+            
+        Note:
+            - Worksheets are resolved once and cached on this instance, so
+              repeated lookups do not issue another metadata request
         """
-        return WorkSheet(self.spreadsheet.worksheet(worksheet_name))
+        worksheet = self._worksheets.get(worksheet_name)
+        if worksheet is None:
+            worksheet = self._worksheets[worksheet_name] = WorkSheet(self.spreadsheet.worksheet(worksheet_name))
+        return worksheet
 
     def create_worksheet(self, worksheet_name: str, rows_n: int, cols_n: int, headers: list[str]) -> WorkSheet:
         """
@@ -189,7 +208,138 @@ class SpreadSheet:
             - Automatically adds the new worksheet to the spreadsheet
             - Logs creation success for tracking
         """
-        return WorkSheet(worksheet=self.spreadsheet.add_worksheet(title=worksheet_name, rows=rows_n, cols=cols_n), headers=headers)
+        worksheet = WorkSheet(worksheet=self.spreadsheet.add_worksheet(title=worksheet_name, rows=rows_n, cols=cols_n), headers=headers)
+        self._worksheets[worksheet_name] = worksheet
+        return worksheet
+
+    def add_rows_batch(self, rows_by_worksheet: dict[str, list[list]]) -> "SpreadSheet":
+        """
+        Append rows to several worksheets with a single API request.
+        
+        Builds one appendCells request per worksheet and sends them together
+        in a single spreadsheets.batchUpdate call, so writing to N tabs costs
+        one write request instead of N. Large writes are split into several
+        batchUpdate calls of at most MAX_ROWS_PER_REQUEST rows each, and the
+        next request body is built while the previous one is uploading.
+        
+        Args:
+            rows_by_worksheet (dict[str, list[list]]): Rows to append keyed by
+                worksheet name
+                
+        Returns:
+            SpreadSheet: The SpreadSheet instance
+            
+        Raises:
+            gspread.WorksheetNotFound: If any of the worksheets does not exist
+            
+        Note:
+            - Rows are appended after the last row with data, like add_rows
+            - Values are parsed as if typed in, like value_input_option=
+              'USER_ENTERED': date strings become dates, numeric strings numbers
+            - Worksheets with no rows are skipped; nothing is sent if all are empty
+        """
+        rows_by_worksheet = {name: rows for name, rows in rows_by_worksheet.items() if rows}
+        if not rows_by_worksheet:
+            return self
+
+        if not self._worksheets.keys() >= rows_by_worksheet.keys():
+            # Resolve every missing tab with a single metadata request
+            for worksheet in self.spreadsheet.worksheets():
+                self._worksheets.setdefault(worksheet.title, WorkSheet(worksheet))
+
+        missing = rows_by_worksheet.keys() - self._worksheets.keys()
+        if missing:
+            raise gspread.WorksheetNotFound(", ".join(sorted(missing)))
+
+        # Payloads are built on this thread while the previous one uploads
+        # on a single worker, which also keeps the requests in order
+        with ThreadPoolExecutor(max_workers=1) as uploader:
+            pending = None
+
+            def flush(requests: list[dict]) -> None:
+                nonlocal pending
+                if pending is not None:
+                    pending.result()
+                pending = uploader.submit(self.spreadsheet.batch_update, {"requests": requests})
+
+            requests = []
+            budget = MAX_ROWS_PER_REQUEST
+            for worksheet_name, rows in rows_by_worksheet.items():
+                sheet_id = self._worksheets[worksheet_name].worksheet.id
+                start = 0
+                while start < len(rows):
+                    chunk = rows[start:start + budget]
+                    start += len(chunk)
+                    budget -= len(chunk)
+                    requests.append({
+                        "appendCells": {
+                            "sheetId": sheet_id,
+                            "rows": [{"values": [_to_cell(value) for value in row]} for row in chunk],
+                            "fields": "userEnteredValue"
+                        }
+                    })
+                    if budget == 0:
+                        flush(requests)
+                        requests = []
+                        budget = MAX_ROWS_PER_REQUEST
+
+            if requests:
+                flush(requests)
+            pending.result()
+        return self
+
+def _chunked(seq: list, n: int):
+    """
+    Yield consecutive slices of at most n items from a sequence.
+    
+    Args:
+        seq (list): Sequence to split
+        n (int): Maximum slice length
+        
+    Yields:
+        list: Consecutive slices of seq
+    """
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+# Text starting with one of these would be evaluated as a formula when sent
+# as formulaValue, so it is written as literal text instead
+_FORMULA_PREFIXES = ("=", "+", "-", "@")
+
+@lru_cache(maxsize=4096, typed=True)
+def _to_cell(value) -> dict:
+    """
+    Convert a Python value into a Sheets API CellData payload.
+    
+    Args:
+        value: Cell value as produced by the to_row() methods
+        
+    Returns:
+        dict: CellData with the matching userEnteredValue type, or an empty
+            dict for None and "" so the cell is left blank
+            
+    Note:
+        - Strings go in formulaValue, which Sheets parses the same way as
+          typed input (USER_ENTERED), so dates keep landing as dates;
+          stringValue would store them verbatim as text
+        - Strings starting with =, +, - or @ are sent as stringValue, so
+          text from API data (e.g. WhatsApp posts) is never run as a formula
+        - Cached: dates, cities, sources and cabins repeat across thousands
+          of cells, so each distinct value is converted once and its CellData
+          shared. Callers must not mutate the returned dict.
+    """
+    if value is None:
+        return {}
+    if isinstance(value, bool):
+        return {"userEnteredValue": {"boolValue": value}}
+    if isinstance(value, numbers.Real):
+        return {"userEnteredValue": {"numberValue": value if isinstance(value, (int, float)) else float(value)}}
+    text = str(value)
+    if not text:
+        return {}
+    if text.startswith(_FORMULA_PREFIXES):
+        return {"userEnteredValue": {"stringValue": text}}
+    return {"userEnteredValue": {"formulaValue": text}}
 
 class GoogleSheetsHandler:
     """
@@ -210,7 +360,7 @@ class GoogleSheetsHandler:
     """
     
     def __init__(self):
-        pass
+        self._spreadsheets: dict[str, SpreadSheet] = dict()
   
     def load(self, google_service_account) -> None: 
         """
@@ -231,6 +381,8 @@ class GoogleSheetsHandler:
                 
         Note:
             - Uses spreadsheets scope for read/write access
+            - All API calls share one keep-alive session with a small
+              connection pool, so consecutive requests skip the TLS handshake
             - Sets global state flag on successful initialization
             - Logs all initialization steps for debugging
         """
@@ -248,7 +400,13 @@ class GoogleSheetsHandler:
                 raise ValueError("Failed to load credentials from the provided info.")
 
             state.logger.info("Authorizing Google Sheets client...")
-            self.client = gspread.authorize(credentials)
+            session = AuthorizedSession(credentials)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("https://", adapter)
+            session.headers["Connection"] = "keep-alive"
+            self.client = gspread.Client(auth=credentials, session=session)
+            # Handles opened with a previous client are no longer valid
+            self._spreadsheets.clear()
             
             if not self.client:
                 state.logger.error("Failed to authorize Google Sheets client with the provided credentials.")
@@ -273,9 +431,33 @@ class GoogleSheetsHandler:
             
         Raises:
             gspread.SpreadsheetNotFound: If the specified spreadsheet does not exist
+            
+        Note:
+            - Spreadsheets are opened once per client and cached by ID, so
+              repeated calls do not issue another open_by_key request
+        """
+        spreadsheet = self._spreadsheets.get(spreadsheet_id)
+        if spreadsheet is None:
+            gspread_spreadsheet = self.client.open_by_key(spreadsheet_id)
+            spreadsheet = self._spreadsheets[spreadsheet_id] = SpreadSheet(gspread_spreadsheet, gspread_spreadsheet.title)
+        return spreadsheet
+
+    def get_worksheet(self, spreadsheet_id: str, worksheet_name: str) -> WorkSheet:
+        """
+        Retrieve a worksheet by spreadsheet ID and worksheet name.
+        
+        Args:
+            spreadsheet_id (str): Unique ID of the Google Spreadsheet
+            worksheet_name (str): Name of the worksheet to retrieve
+            
+        Returns:
+            WorkSheet: The requested worksheet, resolved once and then cached
+            
+        Raises:
+            gspread.SpreadsheetNotFound: If the specified spreadsheet does not exist
+            gspread.WorksheetNotFound: If the specified worksheet does not exist
         """
-        spreadsheet = self.client.open_by_key(spreadsheet_id)
-        return SpreadSheet(spreadsheet, spreadsheet.title)
+        return self.get_sheet(spreadsheet_id).get_worksheet(worksheet_name)
     
 
     
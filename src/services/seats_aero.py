@@ -9,8 +9,9 @@ for reliable flight data retrieval.
 Key Features:
 - Partner API authentication and authorization
 - Cached search queries for specific routes
-- Bulk availability data retrieval across regions
+- Bulk availability data retrieval across regions, cached for a few minutes
 - Individual trip availability lookup
+- Concurrent (asyncio) bulk searches and availability lookups
 - Comprehensive error handling and logging
 - Support for multiple airline sources and cabin classes
 
@@ -26,13 +27,21 @@ API Endpoints:
 - Trip Availability: Get detailed information for specific trips
 """
 
+import asyncio
+import threading
 from time import sleep
+import httpx
 import requests
+from cachetools import TTLCache
 
 from global_state import state
 
 from data_types.enums import REGION, SOURCE, CABIN
 
+# Bulk searches are cached per process for this many seconds
+BULK_CACHE_TTL = 300
+BULK_CACHE_SIZE = 512
+
 
 class SeatsAeroHandler:
     """
@@ -71,6 +80,9 @@ class SeatsAeroHandler:
         self.cached_search_url = "https://seats.aero/partnerapi/search?"
         self.bulk_availability_url = "https://seats.aero/partnerapi/availability"
         self.availability_url = "https://seats.aero/partnerapi/trips/"
+        # Non-empty bulk search results, shared by every pipeline in the process
+        self.bulk_cache = TTLCache(maxsize=BULK_CACHE_SIZE, ttl=BULK_CACHE_TTL)
+        self.bulk_cache_lock = threading.Lock()
     
     def load(self, api_key):
         """
@@ -154,7 +166,8 @@ class SeatsAeroHandler:
                                 start_date: str = None, 
                                 end_date: str = None, 
                                 deepness: int = 1,
-                                cabin: CABIN = None) -> list:
+                                cabin: CABIN = None,
+                                refresh: bool = False) -> list:
         """
         Fetch bulk flight availability data across regions and sources.
         
@@ -170,12 +183,15 @@ class SeatsAeroHandler:
             origin_region (REGION): Origin region enum (e.g., REGION.SOUTH_AMERICA)
             destination_region (REGION): Destination region enum (e.g., REGION.EUROPE)
             deepness (int): Pagination depth for results (default: 1)
+            refresh (bool): Skip the cache and fetch fresh data (default: False)
             
         Returns:
             list: list containing bulk availability data from API response,
                 or empty list if request fails or parameters are invalid
                 
         Note:
+            - Non-empty results are cached for BULK_CACHE_TTL seconds, keyed by
+              the search parameters; failures are never cached
             - Returns empty list instead of raising exceptions for missing params
             - Logs request parameters for debugging
             - Handles API errors gracefully with empty dict return
@@ -188,25 +204,17 @@ class SeatsAeroHandler:
         if not all([source, origin_region, destination_region]):
             return []  # Return empty list if any parameter is missing
 
-        params = {
-            "source": source.value,
-            "origin_region": origin_region.value,
-            "destination_region": destination_region.value,
-            "cabin": cabin.value if cabin else None,
-            "take": 1000
-        }
-
-        if start_date is not None and start_date != "":
-            params["start_date"] = start_date
-        if end_date is not None and end_date != "":
-            params["end_date"] = end_date       
+        cache_key = self._bulk_cache_key(source, origin_region, destination_region, start_date, end_date, deepness, cabin)
+        if not refresh:
+            cached = self._get_cached_bulk(cache_key)
+            if cached is not None:
+                return cached
 
-            
+        params = self._bulk_availability_params(source, origin_region, destination_region, start_date, end_date, cabin)
         state.logger.info(f"Fetching bulk availability with params: {params}")
 
         # Initialize response variables
         response = None
-        responseJson = None
         all_data = []
         seen_ids = set()  # Track IDs to avoid duplicates
 
@@ -214,47 +222,233 @@ class SeatsAeroHandler:
             # Call the api   
             response = requests.get(self.bulk_availability_url, headers=self.headers, params=params)
 
-            if response.status_code == 200:
-                responseJson = response.json()
-                current_data = responseJson.get("data", [])
-                
-                # Deduplicate by ID as recommended by API documentation
-                new_data = []
-                for item in current_data:
-                    item_id = item.get("ID")
-                    if item_id and item_id not in seen_ids:
-                        seen_ids.add(item_id)
-                        new_data.append(item)
-                
-                all_data.extend(new_data)
-                
-                state.logger.info(f"Bulk availability fetched successfully for source: {source.value}. Found {len(current_data)} results, {len(new_data)} unique.")
+            if response.status_code != 200:
+                state.logger.error(f"Failed to fetch bulk availability: {response.status_code} - {response.text}")
+                break
+            if not self._collect_bulk_page(source, response.json(), params, all_data, seen_ids):
+                break
 
-                # Check if there are more results to fetch
-                hasMore = responseJson.get("hasMore", False)
-                cursor = responseJson.get("cursor", None)
-                
-                if hasMore and cursor:
-                    # Update cursor for next request
-                    params["cursor"] = cursor
-                    # Update skip to the total number of results we've processed
-                    params["skip"] = len(all_data)
-                    state.logger.info(f"Continuing to fetch more results with cursor: {cursor} and skip: {params['skip']}")
-                else:
-                    # No more data to fetch
-                    break
-            else:
+        return self._cache_bulk(cache_key, self._bulk_availability_result(response, all_data))
+
+    async def fetch_bulk_availability_async(self, client: httpx.AsyncClient,
+                                            source: SOURCE,
+                                            origin_region: REGION,
+                                            destination_region: REGION,
+                                            start_date: str = None,
+                                            end_date: str = None,
+                                            deepness: int = 1,
+                                            cabin: CABIN = None,
+                                            refresh: bool = False) -> list:
+        """
+        Asynchronous counterpart of fetch_bulk_availability.
+        
+        Same parameters, pagination, deduplication and cache as the synchronous
+        version, but requests go through the given shared client so many
+        searches can be in flight on one event loop.
+        
+        Args:
+            client (httpx.AsyncClient): Client from new_async_client()
+            (remaining arguments as in fetch_bulk_availability)
+            
+        Returns:
+            list: Bulk availability data, or an empty list if the request fails
+        """
+        if not all([source, origin_region, destination_region]):
+            return []  # Return empty list if any parameter is missing
+
+        cache_key = self._bulk_cache_key(source, origin_region, destination_region, start_date, end_date, deepness, cabin)
+        if not refresh:
+            cached = self._get_cached_bulk(cache_key)
+            if cached is not None:
+                return cached
+
+        params = self._bulk_availability_params(source, origin_region, destination_region, start_date, end_date, cabin)
+        state.logger.info(f"Fetching bulk availability with params: {params}")
+
+        response = None
+        all_data = []
+        seen_ids = set()  # Track IDs to avoid duplicates
+
+        for i in range(1, deepness + 1):
+            response = await client.get(self.bulk_availability_url, params=params)
+
+            if response.status_code != 200:
                 state.logger.error(f"Failed to fetch bulk availability: {response.status_code} - {response.text}")
                 break
+            if not self._collect_bulk_page(source, response.json(), params, all_data, seen_ids):
+                break
+
+        return self._cache_bulk(cache_key, self._bulk_availability_result(response, all_data))
+
+    async def fetch_bulk_availabilities(self, tasks: dict, max_concurrency: int = 16, follow_up=None) -> dict:
+        """
+        Run many bulk availability searches concurrently on one event loop.
+        
+        Args:
+            tasks (dict[tuple, dict]): fetch_bulk_availability keyword arguments
+                keyed by an identifier chosen by the caller (e.g. (region, source))
+            max_concurrency (int): Maximum number of searches in flight at once
+                (default: 16)
+            follow_up (Callable[[tuple, list], dict[tuple, dict]], optional): Called
+                with each finished search's key and result; any searches it
+                returns are started right away, without waiting for the rest
+                
+        Returns:
+            dict[tuple, list]: Search results keyed like tasks (including follow-up
+                searches). Failed searches are logged and map to an empty list.
+                
+        Note:
+            - Run it from synchronous code with asyncio.run(...)
+        """
+        results: dict = dict()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with self.new_async_client(max_concurrency) as client:
+            async def search(key, kwargs: dict) -> None:
+                async with semaphore:
+                    try:
+                        results[key] = await self.fetch_bulk_availability_async(client, **kwargs)
+                    except Exception as e:
+                        state.logger.error(f"Failed to fetch bulk availability for {key}. Error: {str(e)}")
+                        results[key] = []
+
+                if follow_up is not None:
+                    await asyncio.gather(*(search(k, v) for k, v in follow_up(key, results[key]).items()))
+
+            await asyncio.gather(*(search(key, kwargs) for key, kwargs in tasks.items()))
+
+        return results
+
+    @staticmethod
+    def _bulk_cache_key(source: SOURCE, origin_region: REGION, destination_region: REGION,
+                        start_date: str, end_date: str, deepness: int, cabin: CABIN) -> tuple:
+        """
+        Build the cache key for a bulk availability search.
+        
+        Returns:
+            tuple: Search parameters, with empty dates normalized to None
+        """
+        return (source, origin_region, destination_region, start_date or None, end_date or None, deepness, cabin)
+
+    def _get_cached_bulk(self, cache_key: tuple) -> list:
+        """
+        Look up a cached bulk availability result.
+        
+        Args:
+            cache_key (tuple): Key from _bulk_cache_key
+            
+        Returns:
+            list: A copy of the cached result, or None on a miss
+        """
+        with self.bulk_cache_lock:
+            cached = self.bulk_cache.get(cache_key)
+        if cached is None:
+            return None
+        state.logger.info(f"Bulk availability cache hit for {cache_key}")
+        return list(cached)
+
+    def _cache_bulk(self, cache_key: tuple, data: list) -> list:
+        """
+        Store a bulk availability result if it is worth caching.
+        
+        Args:
+            cache_key (tuple): Key from _bulk_cache_key
+            data (list): Search result; empty results are not cached
+            
+        Returns:
+            list: data, unchanged
+        """
+        if data:
+            with self.bulk_cache_lock:
+                self.bulk_cache[cache_key] = list(data)
+        return data
+
+    @staticmethod
+    def _bulk_availability_params(source: SOURCE, origin_region: REGION, destination_region: REGION,
+                                  start_date: str = None, end_date: str = None, cabin: CABIN = None) -> dict:
+        """
+        Build the query parameters for a bulk availability request.
+        
+        Returns:
+            dict: Query parameters; optional filters are only included when set
+        """
+        params = {
+            "source": source.value,
+            "origin_region": origin_region.value,
+            "destination_region": destination_region.value,
+            "take": 1000
+        }
+        if cabin:
+            params["cabin"] = cabin.value
+        if start_date is not None and start_date != "":
+            params["start_date"] = start_date
+        if end_date is not None and end_date != "":
+            params["end_date"] = end_date
+        return params
+
+    @staticmethod
+    def _collect_bulk_page(source: SOURCE, responseJson: dict, params: dict, all_data: list, seen_ids: set) -> bool:
+        """
+        Merge one page of bulk availability results and prepare the next request.
+        
+        Args:
+            source (SOURCE): Source being fetched, for logging
+            responseJson (dict): Decoded API response for the page
+            params (dict): Request parameters, updated in place with the cursor
+            all_data (list): Accumulated unique results, extended in place
+            seen_ids (set): IDs already collected, updated in place
+            
+        Returns:
+            bool: True if there are more pages to fetch
+        """
+        current_data = responseJson.get("data", [])
+        
+        # Deduplicate by ID as recommended by API documentation
+        new_data = []
+        for item in current_data:
+            item_id = item.get("ID")
+            if item_id and item_id not in seen_ids:
+                seen_ids.add(item_id)
+                new_data.append(item)
+        
+        all_data.extend(new_data)
+        
+        state.logger.info(f"Bulk availability fetched successfully for source: {source.value}. Found {len(current_data)} results, {len(new_data)} unique.")
+
+        # Check if there are more results to fetch
+        hasMore = responseJson.get("hasMore", False)
+        cursor = responseJson.get("cursor", None)
+        
+        if hasMore and cursor:
+            # Update cursor for next request
+            params["cursor"] = cursor
+            # Update skip to the total number of results we've processed
+            params["skip"] = len(all_data)
+            state.logger.info(f"Continuing to fetch more results with cursor: {cursor} and skip: {params['skip']}")
+            return True
+        # No more data to fetch
+        return False
 
+    @staticmethod
+    def _bulk_availability_result(response, all_data: list) -> list:
+        """
+        Decide the outcome of a paginated bulk availability fetch.
         
-        if response and response.status_code == 200 and all_data:
+        Args:
+            response: Last HTTP response received (requests or httpx)
+            all_data (list): Accumulated unique results
+            
+        Returns:
+            list: all_data if the last page succeeded and data was found,
+                otherwise an empty list
+        """
+        if response is not None and response.status_code == 200 and all_data:
             state.logger.info(f"Bulk availability fetched successfully with {len(all_data)} unique results.")
             return all_data
         # If no data was fetched, log the error and return empty list
-        else:
+        if response is not None:
             state.logger.error(f"Failed to fetch bulk availability: {response.status_code} - {response.text}")
-            return []  # Return empty list if the request fails
+        return []  # Return empty list if the request fails
 
     def fetch_availability(self, trip_id) -> dict:
         """
@@ -289,6 +483,67 @@ class SeatsAeroHandler:
 
         return res.json() 
 
+    async def fetch_availabilities(self, trip_ids, max_connections: int = 16) -> dict[str, dict]:
+        """
+        Fetch detailed availability for many trips concurrently.
+        
+        Asynchronous counterpart of fetch_availability for bulk lookups. All
+        requests share a single HTTP/2 client, so they are multiplexed over a
+        small pool of keep-alive connections instead of paying one TLS
+        handshake per trip.
+        
+        Args:
+            trip_ids (Iterable[str]): Unique identifiers of the trips to fetch
+            max_connections (int): Maximum number of simultaneous connections
+                to Seats.aero (default: 16)
+                
+        Returns:
+            dict[str, dict]: Trip availability data keyed by trip ID. Trips whose
+                request failed map to None, mirroring fetch_availability.
+                
+        Note:
+            - Run it from synchronous code with asyncio.run(...)
+            - Errors are logged per trip and never abort the whole batch
+            - Duplicate IDs are collapsed, so each trip costs one request
+        """
+        async with self.new_async_client(max_connections) as client:
+            # Each ID is requested once, even if the caller repeats it
+            trip_ids = list(dict.fromkeys(trip_ids))
+            responses = await asyncio.gather(
+                *(client.get(f"{self.availability_url}{trip_id}") for trip_id in trip_ids),
+                return_exceptions=True
+            )
+
+        availabilities: dict[str, dict] = dict()
+        for trip_id, res in zip(trip_ids, responses):
+            if isinstance(res, Exception):
+                state.logger.error(f"Failed to fetch availability for {trip_id}: {res}")
+                availabilities[trip_id] = None
+            elif res.status_code != 200:
+                state.logger.error(f"Failed to fetch availability for {trip_id}: {res.status_code} - {res.text}")
+                availabilities[trip_id] = None
+            else:
+                availabilities[trip_id] = res.json()
+
+        return availabilities
+
+
+    def new_async_client(self, max_connections: int = 16) -> httpx.AsyncClient:
+        """
+        Create an authenticated HTTP/2 client for the asynchronous methods.
+        
+        Args:
+            max_connections (int): Maximum number of simultaneous connections
+                to Seats.aero (default: 16)
+                
+        Returns:
+            httpx.AsyncClient: Client to be used as an async context manager
+        """
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        # No pool timeout: requests beyond the connection limit simply queue
+        timeout = httpx.Timeout(30, pool=None)
+        return httpx.AsyncClient(http2=True, headers=self.headers, limits=limits, timeout=timeout)
+
 
 # Create a singleton instance for use throughout the application
 seats_aero_handler = SeatsAeroHandler()
\ No newline at end of file
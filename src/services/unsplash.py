@@ -27,6 +27,8 @@ Usage Context:
 - Destination-specific imagery for promotions
 """
 
+import os
+import tempfile
 import requests
 from io import BytesIO
 
@@ -92,8 +94,12 @@ def fetch_image(query: str) -> list[Image]:
     if not image_urls:
         raise Exception("No images found for the query.")
 
+    # Each query gets its own folder so cleanup can remove it in one go
+    os.makedirs(DEFAULT_FOLDER, exist_ok=True)
+    folder = tempfile.mkdtemp(prefix="query_", dir=DEFAULT_FOLDER)
+
     # Need to have a unique name to avoid overwriting files
-    return [Image(url, save_image_in_disk(f"{hash(url)}.jpg", bytes(download_image(url)))) for url in image_urls]
+    return [Image(url, save_image_in_disk(f"{hash(url)}.jpg", bytes(download_image(url)), folder)) for url in image_urls]
 
 
 def download_image(url: str) -> bytes:
@@ -140,13 +146,14 @@ def download_image(url: str) -> bytes:
     return response.content
 
 DEFAULT_FOLDER = "images"
-def save_image_in_disk(filename: str, image_data: bytes) -> str:
+def save_image_in_disk(filename: str, image_data: bytes, folder: str = DEFAULT_FOLDER) -> str:
     """
     Save image binary data to disk as a file.
 
     Args:
         filename (str): The local file path where the image should be saved
         image_data (bytes): The binary data of the image to be saved
+        folder (str): Folder to save the image into (default: DEFAULT_FOLDER)
 
     Returns:
         str: The full path to the saved image file
@@ -163,12 +170,11 @@ def save_image_in_disk(filename: str, image_data: bytes) -> str:
         >>> save_image_in_disk("paris_attraction.jpg", img_data)
     """
 
-    import os
-    if not os.path.exists(DEFAULT_FOLDER):
-        os.makedirs(DEFAULT_FOLDER)
+    os.makedirs(folder, exist_ok=True)
 
-    with open(os.path.join(DEFAULT_FOLDER, filename), 'wb') as f:
+    path = os.path.join(folder, filename)
+    with open(path, 'wb') as f:
         f.write(image_data)
     
-    return DEFAULT_FOLDER + "/" + filename
+    return path
         
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Tests for the batched Google Sheets writes in services.google_sheets.
+"""
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from services.google_sheets import SpreadSheet, MAX_ROWS_PER_REQUEST, _chunked, _to_cell
+
+
+class TestToCell(unittest.TestCase):
+    def test_blank_values(self):
+        self.assertEqual(_to_cell(None), {})
+        self.assertEqual(_to_cell(""), {})
+
+    def test_numbers_and_bools(self):
+        self.assertEqual(_to_cell(1500), {"userEnteredValue": {"numberValue": 1500}})
+        self.assertEqual(_to_cell(12.5), {"userEnteredValue": {"numberValue": 12.5}})
+        self.assertEqual(_to_cell(True), {"userEnteredValue": {"boolValue": True}})
+        self.assertEqual(_to_cell(0), {"userEnteredValue": {"numberValue": 0}})
+        self.assertEqual(_to_cell(False), {"userEnteredValue": {"boolValue": False}})
+
+    def test_text_is_parsed_like_typed_input(self):
+        # formulaValue gets USER_ENTERED parsing, so dates land as dates
+        self.assertEqual(_to_cell("2025-03-01"), {"userEnteredValue": {"formulaValue": "2025-03-01"}})
+        self.assertEqual(_to_cell("R$ 12.34 (BRL)"), {"userEnteredValue": {"formulaValue": "R$ 12.34 (BRL)"}})
+
+    def test_formula_like_text_stays_literal(self):
+        for text in ("=IMPORTXML(\"x\")", "+55 11 9999", "- promo", "@user"):
+            with self.subTest(text=text):
+                self.assertEqual(_to_cell(text), {"userEnteredValue": {"stringValue": text}})
+
+
+class TestChunked(unittest.TestCase):
+    def test_slices(self):
+        self.assertEqual(list(_chunked(list(range(5)), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(_chunked([], 2)), [])
+
+
+class TestAddRowsBatch(unittest.TestCase):
+    def setUp(self):
+        self.spreadsheet = mock.Mock()
+        self.spreadsheet.worksheets.return_value = [
+            SimpleNamespace(title="singles", id=1),
+            SimpleNamespace(title="rounds", id=2),
+        ]
+        self.sheet = SpreadSheet(self.spreadsheet, "results")
+
+    def sent_requests(self) -> list[list[dict]]:
+        return [call.args[0]["requests"] for call in self.spreadsheet.batch_update.call_args_list]
+
+    def test_one_request_for_several_tabs(self):
+        self.sheet.add_rows_batch({"singles": [["a", 1]], "rounds": [["b", None]], "empty": []})
+
+        (requests,) = self.sent_requests()
+        self.assertEqual([request["appendCells"]["sheetId"] for request in requests], [1, 2])
+        self.assertEqual(requests[0]["appendCells"]["rows"], [{"values": [_to_cell("a"), _to_cell(1)]}])
+        self.assertEqual(requests[1]["appendCells"]["rows"], [{"values": [_to_cell("b"), {}]}])
+        self.assertEqual(requests[0]["appendCells"]["fields"], "userEnteredValue")
+
+    def test_large_writes_are_split_in_order(self):
+        singles = [[f"s{i}"] for i in range(MAX_ROWS_PER_REQUEST + 200)]
+        rounds = [[f"r{i}"] for i in range(MAX_ROWS_PER_REQUEST - 100)]
+        self.sheet.add_rows_batch({"singles": singles, "rounds": rounds})
+
+        calls = self.sent_requests()
+        rows_per_call = [sum(len(request["appendCells"]["rows"]) for request in requests) for requests in calls]
+        self.assertEqual(rows_per_call, [MAX_ROWS_PER_REQUEST, MAX_ROWS_PER_REQUEST, 100])
+
+        # Every row is sent once, in order, to its own tab
+        written = {1: [], 2: []}
+        for requests in calls:
+            for request in requests:
+                cells = request["appendCells"]
+                written[cells["sheetId"]].extend(row["values"][0]["userEnteredValue"]["formulaValue"] for row in cells["rows"])
+        self.assertEqual(written[1], [row[0] for row in singles])
+        self.assertEqual(written[2], [row[0] for row in rounds])
+
+    def test_nothing_sent_without_rows(self):
+        self.sheet.add_rows_batch({"singles": []})
+        self.spreadsheet.batch_update.assert_not_called()
+
+    def test_unknown_tab(self):
+        import gspread
+        with self.assertRaises(gspread.WorksheetNotFound):
+            self.sheet.add_rows_batch({"missing": [["x"]]})
+        self.spreadsheet.batch_update.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
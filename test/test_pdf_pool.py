@@ -0,0 +1,61 @@
+"""
+Tests for rendering single-trip PDFs through the process pool.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import alerts_runner
+from logic import pdf_generator
+
+
+class FakeTripOption:
+    """
+    Picklable stand-in with just the attributes the single-trip PDF reads.
+    """
+    def __init__(self, availability_id: str):
+        self.availability_Id = availability_id
+        self.release_date = "2025-01-01"
+        self.departure_date = "2025-02-01"
+        self.arrival_date = "2025-02-01"
+        self.origin_airport = "GRU"
+        self.destination_airport = "LIS"
+        self.source = "smiles"
+        self.booking_links = ["https://example.com"]
+        self.images = []
+
+    def selling_price_to_str(self) -> str:
+        return "R$ 1234.56 (BRL)"
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "the PDF pool needs the fork start method")
+class TestIterSinglePdfs(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+
+    def test_renders_a_batch_through_the_pool(self):
+        options = [FakeTripOption(f"id{i}") for i in range(alerts_runner.PARALLEL_PDF_THRESHOLD + 2)]
+
+        with mock.patch.object(pdf_generator, "DEFAULT_FOLDER", self.folder), \
+                mock.patch.object(alerts_runner, "_usable_cpu_count", return_value=2), \
+                mock.patch.object(alerts_runner, "ProcessPoolExecutor", wraps=alerts_runner.ProcessPoolExecutor) as pool:
+            pdfs = list(alerts_runner._iter_single_pdfs(options))
+
+        pool.assert_called_once()
+        self.assertEqual(pool.call_args.kwargs["mp_context"].get_start_method(), "fork")
+        # One PDF per option, in order, each actually written by a worker
+        self.assertEqual([pdf.title for pdf in pdfs], [f"2025-01-01 id{i}" for i in range(len(options))])
+        for pdf in pdfs:
+            self.assertTrue(os.path.isfile(pdf.filePath))
+            self.assertEqual(os.path.dirname(pdf.filePath), self.folder)
+
+
+if __name__ == "__main__":
+    unittest.main()
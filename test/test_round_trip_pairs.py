@@ -0,0 +1,124 @@
+"""
+Tests for the column-wise round-trip pairing in logic.filter.
+
+The pairs are checked against the row-by-row loop the filter used before.
+"""
+
+import os
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from logic.filter import _round_trip_pairs, flight_Filter
+
+
+def legacy_pairs(outbound_dates: list, return_dates: list, min_return_days=None, max_return_days=None) -> list[tuple[int, int]]:
+    """
+    Pairing as done by the previous nested iterrows loop, by position.
+    """
+    pairs = []
+    for i, outbound in enumerate(outbound_dates):
+        for j, return_ in enumerate(return_dates):
+            if return_ <= outbound:
+                continue
+            if min_return_days and max_return_days:
+                interval = (return_ - outbound).days
+                if interval < min_return_days or interval > max_return_days:
+                    continue
+            pairs.append((i, j))
+    return pairs
+
+
+def vectorized_pairs(outbound_dates: list, return_dates: list, min_return_days=None, max_return_days=None) -> list[tuple[int, int]]:
+    outbound_idx, return_idx = _round_trip_pairs(
+        pd.Series(pd.to_datetime(outbound_dates)).to_numpy(),
+        pd.Series(pd.to_datetime(return_dates)).to_numpy(),
+        min_return_days,
+        max_return_days,
+    )
+    return list(zip(outbound_idx.tolist(), return_idx.tolist()))
+
+
+def dates(*values: str) -> list:
+    return list(pd.to_datetime(list(values), format="ISO8601"))
+
+
+class TestRoundTripPairs(unittest.TestCase):
+    def assertMatchesLegacy(self, outbound, return_, min_return_days=None, max_return_days=None):
+        self.assertEqual(
+            vectorized_pairs(outbound, return_, min_return_days, max_return_days),
+            legacy_pairs(outbound, return_, min_return_days, max_return_days),
+        )
+
+    def test_return_must_be_after_outbound(self):
+        outbound = dates("2025-03-01", "2025-03-05", "2025-03-10")
+        return_ = dates("2025-03-02", "2025-03-06", "2025-03-12", "2025-02-20")
+        self.assertMatchesLegacy(outbound, return_)
+
+    def test_same_day_return_is_not_paired(self):
+        outbound = dates("2025-03-01 10:00", "2025-03-05")
+        return_ = dates("2025-03-01 10:00", "2025-03-05", "2025-03-06")
+        self.assertMatchesLegacy(outbound, return_)
+        self.assertEqual(vectorized_pairs(outbound, return_), [(0, 1), (0, 2), (1, 2)])
+
+    def test_return_day_bounds_are_inclusive(self):
+        outbound = dates("2025-03-01", "2025-03-02")
+        return_ = dates("2025-03-03", "2025-03-04", "2025-03-08", "2025-03-09", "2025-03-10")
+        self.assertMatchesLegacy(outbound, return_, min_return_days=2, max_return_days=7)
+        self.assertEqual(
+            vectorized_pairs(outbound, return_, 2, 7),
+            [(0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (1, 3)],
+        )
+
+    def test_interval_counts_whole_days(self):
+        # 1 day 23 hours is 1 whole day, as with Timedelta.days
+        outbound = dates("2025-03-01 01:00")
+        return_ = dates("2025-03-03 00:00", "2025-03-03 01:00")
+        self.assertMatchesLegacy(outbound, return_, min_return_days=2, max_return_days=5)
+        self.assertEqual(vectorized_pairs(outbound, return_, 2, 5), [(0, 1)])
+
+    def test_only_one_bound_set_applies_no_bounds(self):
+        outbound = dates("2025-03-01")
+        return_ = dates("2025-03-02", "2025-03-20", "2025-05-01")
+        for min_return_days, max_return_days in ((3, None), (None, 10), (0, 10), (3, 0)):
+            with self.subTest(min_return_days=min_return_days, max_return_days=max_return_days):
+                self.assertMatchesLegacy(outbound, return_, min_return_days, max_return_days)
+                self.assertEqual(vectorized_pairs(outbound, return_, min_return_days, max_return_days), [(0, 0), (0, 1), (0, 2)])
+
+    def test_unparseable_dates_never_pair(self):
+        # The old loop kept pairs with a NaT date (NaT comparisons are False,
+        # so nothing skipped them); they are now dropped on purpose.
+        outbound = dates("2025-03-01", None)
+        return_ = dates(None, "2025-03-04")
+        for bounds in ((None, None), (1, 10)):
+            with self.subTest(bounds=bounds):
+                legacy = legacy_pairs(outbound, return_, *bounds)
+                expected = [(i, j) for i, j in legacy if not (pd.isna(outbound[i]) or pd.isna(return_[j]))]
+                self.assertEqual(vectorized_pairs(outbound, return_, *bounds), expected)
+                self.assertEqual(expected, [(0, 1)])
+
+    def test_no_flights(self):
+        self.assertEqual(vectorized_pairs([], dates("2025-03-01")), [])
+        self.assertEqual(vectorized_pairs(dates("2025-03-01"), []), [])
+
+
+class TestFilterTrip(unittest.TestCase):
+    def setUp(self):
+        self.filter_trip = flight_Filter._Flight_Filter__filter_trip
+
+    def test_origin_country(self):
+        row = pd.Series({"origin_country": "BR", "destination_country": "PT", "origin_city": "Sao Paulo"})
+        self.assertTrue(self.filter_trip(row, {"origin_country": "BR"}))
+        self.assertFalse(self.filter_trip(row, {"origin_country": "US"}))
+
+    def test_city_filters(self):
+        row = pd.Series({"origin_city": "Sao Paulo", "destination_city": "Lisbon"})
+        self.assertTrue(self.filter_trip(row, {"destination_cities": ["Lisbon"]}))
+        self.assertFalse(self.filter_trip(row, {"exclude_origin_cities": ["Sao Paulo"]}))
+
+
+if __name__ == "__main__":
+    unittest.main()